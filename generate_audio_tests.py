@@ -5,9 +5,12 @@
 """
 
 import sys
+import subprocess
 from pathlib import Path
 import logging
 
+import numpy as np
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,6 +19,32 @@ logger = logging.getLogger(__name__)
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# 重采样使用的采样率
+AUDIO_FPS = 44100
+
+
+def speed_up_samples(samples: np.ndarray, speed: float) -> np.ndarray:
+    """按倍速对采样数组做线性插值重采样（形状为 [样本数, 声道数]）"""
+    n_out = int(len(samples) / speed)
+    positions = np.arange(n_out, dtype=np.float64) * speed
+    left = positions.astype(np.int64)
+    right = np.minimum(left + 1, len(samples) - 1)
+    frac = (positions - left).astype(samples.dtype)[:, None]
+    return (1 - frac) * samples[left] + frac * samples[right]
+
+
+def write_samples(samples: np.ndarray, output_file: Path):
+    """通过ffmpeg管道把采样数组直接编码写入文件"""
+    from imageio_ffmpeg import get_ffmpeg_exe  # moviepy自带的ffmpeg
+    
+    cmd = [
+        get_ffmpeg_exe(), '-loglevel', 'error', '-y',
+        '-f', 'f32le', '-ar', str(AUDIO_FPS), '-ac', str(samples.shape[1]),
+        '-i', 'pipe:0', str(output_file),
+    ]
+    subprocess.run(cmd, input=samples.astype(np.float32).tobytes(), check=True)
+
+
 def generate_test_audio():
     """生成不同速度的测试音频"""
     print("🎵 生成音频速度测试文件")
@@ -43,6 +72,9 @@ def generate_test_audio():
         original_duration = audio.duration
         print(f"⏱️  原始时长: {original_duration:.3f} 秒")
         
+        # 一次性解码成采样数组，各倍速版本直接在数组上重采样
+        samples = audio.to_soundarray(fps=AUDIO_FPS).astype(np.float32)
+        
         # 生成不同速度的版本
         speeds = [1.0, 1.1, 1.2, 1.25, 1.3, 1.5]
         
@@ -52,13 +84,11 @@ def generate_test_audio():
             if speed == 1.0:
                 # 原始速度直接复制
                 output_file = test_dir / f"original_{speed}x.mp3"
-                audio.write_audiofile(str(output_file))
+                write_samples(samples, output_file)
             else:
                 # 应用速度变换
-                audio_sped = audio.fl_time(lambda t: t * speed).set_duration(original_duration / speed)
                 output_file = test_dir / f"speed_{speed}x.mp3"
-                audio_sped.write_audiofile(str(output_file))
-                audio_sped.close()
+                write_samples(speed_up_samples(samples, speed), output_file)
             
             # 验证生成的文件
             if output_file.exists():
@@ -522,7 +522,7 @@ class CrawlerService:
         """处理GIF格式的data URI"""
         try:
             # 解码base64数据
-            import base64
+            import binascii
             import re
             
             # 提取base64数据部分
@@ -531,7 +531,7 @@ class CrawlerService:
                 return {'url': data_uri[:50], 'success': False, 'error': 'Invalid GIF data URI format'}
             
             base64_data = match.group(1)
-            gif_data = base64.b64decode(base64_data)
+            gif_data = binascii.a2b_base64(base64_data)
             
             # 保存GIF文件
             filename = f"image_{index:03d}.gif"
@@ -39,26 +39,36 @@ class GIFProcessor:
         except Exception:
             return False
     
-    def extract_gif_frames(self, gif_path: str) -> Optional[List[np.ndarray]]:
-        """提取GIF动画帧"""
+    def extract_gif_frames(self, gif_path: str, out: Optional[np.ndarray] = None) -> Optional[List[np.ndarray]]:
+        """提取GIF动画帧
+        
+        out: 可选的 (帧数, 高, 宽, 3) uint8 缓冲区，尺寸匹配且容量足够时直接复用，
+             返回的帧是其中的视图（下次复用前需用完）
+        """
         try:
             if not self.is_gif_file(gif_path):
                 logger.warning(f"文件不是GIF格式: {gif_path}")
                 return None
             
-            # 使用imageio读取GIF帧
-            reader = imageio.get_reader(gif_path)
-            frames = []
-            
-            for frame in reader:
-                # 转换为numpy数组
-                if isinstance(frame, np.ndarray):
-                    frames.append(frame)
+            with Image.open(gif_path) as im:
+                frame_count = getattr(im, 'n_frames', 1)
+                width, height = im.size
+                # 所有帧写入一块预分配的连续内存，返回的是其中每帧的视图
+                if (out is not None and out.dtype == np.uint8
+                        and out.shape[1:] == (height, width, 3) and len(out) >= frame_count):
+                    buffer = out[:frame_count]
                 else:
-                    # 如果是PIL Image，转换为numpy数组
-                    frames.append(np.array(frame))
+                    buffer = np.empty((frame_count, height, width, 3), dtype=np.uint8)
+                
+                for i in range(frame_count):
+                    im.seek(i)
+                    if im.mode == 'P':
+                        # 调色板索引帧：用数组查表一次性完成索引到RGB的转换
+                        buffer[i] = self._palette_lut(im)[np.asarray(im)]
+                    else:
+                        buffer[i] = np.asarray(im.convert('RGB'))
             
-            reader.close()
+            frames = list(buffer)
             
             if not frames:
                 logger.warning(f"GIF文件没有有效帧: {gif_path}")
@@ -71,6 +81,14 @@ class GIFProcessor:
             logger.error(f"提取GIF帧失败 {gif_path}: {e}")
             return None
     
+    @staticmethod
+    def _palette_lut(im: Image.Image) -> np.ndarray:
+        """构造256项的调色板查找表（调色板不足256色时补零）"""
+        lut = np.zeros((256, 3), dtype=np.uint8)
+        palette = np.asarray(im.getpalette() or [], dtype=np.uint8).reshape(-1, 3)[:256]
+        lut[:len(palette)] = palette
+        return lut
+    
     def get_gif_properties(self, gif_path: str) -> Dict:
         """获取GIF属性信息"""
         try:
@@ -98,21 +116,28 @@ class GIFProcessor:
                            gif_path: str, 
                            output_path: str,
                            target_fps: Optional[float] = None,
-                           target_duration: Optional[float] = None) -> bool:
-        """将GIF转换为视频文件"""
+                           target_duration: Optional[float] = None,
+                           threads: Optional[int] = None,
+                           frames: Optional[List[np.ndarray]] = None,
+                           props: Optional[Dict] = None) -> bool:
+        """将GIF转换为视频文件
+        
+        threads: ffmpeg编码线程数，多进程并行转换时设为1避免CPU过载
+        frames/props: 已提取的帧和属性（见load_and_analyze），传入时不再重复读取文件
+        """
         try:
             # 检查MoviePy是否可用
             if ImageSequenceClip is None:
                 logger.error("MoviePy不可用，无法进行视频转换")
                 return False
             
-            # 提取帧
-            frames = self.extract_gif_frames(gif_path)
+            # 提取帧（复制列表，下面补帧时不影响调用方）
+            frames = list(frames) if frames else self.extract_gif_frames(gif_path)
             if not frames:
                 return False
             
             # 获取原始属性
-            gif_props = self.get_gif_properties(gif_path)
+            gif_props = props if props is not None else self.get_gif_properties(gif_path)
             original_frame_count = len(frames)
             
             # 计算帧率
@@ -139,7 +164,7 @@ class GIFProcessor:
             
             # 创建视频片段
             clip = ImageSequenceClip(frames, fps=fps)
-            clip.write_videofile(output_path, codec='libx264', audio=False)
+            clip.write_videofile(output_path, codec='libx264', audio=False, threads=threads)
             clip.close()
             
             logger.info(f"GIF转换成功: {gif_path} -> {output_path}")
@@ -191,8 +216,15 @@ class GIFProcessor:
             logger.error(f"处理GIF失败: {e}")
             return None
     
-    def analyze_gif_compatibility(self, gif_path: str) -> Dict:
-        """分析GIF与视频处理的兼容性"""
+    def load_and_analyze(self, gif_path: str) -> Tuple[Optional[List[np.ndarray]], Dict, Dict]:
+        """一次读取GIF，返回 (帧列表, 属性, 兼容性分析)，可直接传给convert_gif_to_video"""
+        props = self.get_gif_properties(gif_path)
+        analysis = self.analyze_gif_compatibility(gif_path, props=props)
+        frames = self.extract_gif_frames(gif_path) if props else None
+        return frames, props, analysis
+    
+    def analyze_gif_compatibility(self, gif_path: str, props: Optional[Dict] = None) -> Dict:
+        """分析GIF与视频处理的兼容性（可传入已读取的属性）"""
         try:
             analysis = {
                 'is_valid': False,
@@ -211,7 +243,8 @@ class GIFProcessor:
                 return analysis
             
             # 获取属性
-            props = self.get_gif_properties(gif_path)
+            if props is None:
+                props = self.get_gif_properties(gif_path)
             
             if not props:
                 analysis['issues'].append('无法读取GIF属性')
@@ -3,6 +3,7 @@ GitHub项目主页截图服务
 使用Playwright进行网页渲染和截图
 """
 import asyncio
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from playwright.async_api import async_playwright, Browser, Page
@@ -277,6 +278,56 @@ class SyncGitHubScreenshotService:
     
     def __init__(self, headless: bool = True):
         self.headless = headless
+        # 作为上下文管理器使用时，浏览器只启动一次，所有截图共用
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._service: Optional[GitHubScreenshotService] = None
+    
+    def __enter__(self):
+        """启动共享浏览器（失败时退回每次截图单独启动）"""
+        import sys
+        python_version = sys.version_info
+        if python_version.major == 3 and python_version.minor >= 13 and sys.platform == 'win32':
+            return self
+        
+        self._set_event_loop_policy()
+        # 共享浏览器运行在后台线程的事件循环中，可从多个线程同时提交截图
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
+        service = GitHubScreenshotService(self.headless)
+        try:
+            asyncio.run_coroutine_threadsafe(service.start(), self._loop).result()
+            self._service = service
+        except Exception as e:
+            logger.warning(f"共享浏览器启动失败，改为逐次启动: {e}")
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """关闭共享浏览器"""
+        if self._loop is None:
+            return
+        try:
+            if self._service:
+                asyncio.run_coroutine_threadsafe(self._service.stop(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+            self._service = None
+    
+    @staticmethod
+    def _set_event_loop_policy():
+        """为Windows设置适当的事件循环策略"""
+        import sys
+        if sys.platform == 'win32':
+            if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
+                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+            elif hasattr(asyncio, 'WindowsSelectorEventLoopPolicy'):
+                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     
     def take_screenshot_sync(self, 
                            github_url: str, 
@@ -293,15 +344,19 @@ class SyncGitHubScreenshotService:
                 logger.info(f"检测到Python {python_version.major}.{python_version.minor} on Windows，使用Selenium替代方案")
                 return self._try_selenium_screenshot(github_url, save_path, options)
             
+            # 已启动共享浏览器时直接提交到其事件循环
+            if self._service:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._service.take_screenshot(github_url, save_path, options),
+                    self._loop
+                )
+                if future.result():
+                    return True
+                logger.info("共享浏览器截图失败，使用基础降级截图")
+                return self._fallback_screenshot(github_url, save_path)
+            
             # 尝试使用Playwright截图
-            import asyncio
-            
-            if sys.platform == 'win32':
-                # 为Windows设置适当的事件循环策略
-                if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                elif hasattr(asyncio, 'WindowsSelectorEventLoopPolicy'):
-                    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            self._set_event_loop_policy()
             
             # 创建新的事件循环
             try:
@@ -21,6 +21,9 @@ from services.github_screenshot_service import (
 from services.github_storage_service import StorageConfig, ProjectStorageManager
 from services.github_content_service import ContentAnalyzer
 
+# 超过该长度的README在工作线程中提取图片
+LARGE_README_THRESHOLD = 50 * 1024
+
 
 class GitHubProcessingService:
     """GitHub项目处理主服务"""
@@ -50,6 +53,7 @@ class GitHubProcessingService:
             logger.info(f"项目基本信息解析完成: {project_base.name}")
             
             # 2. 获取README内容
+            # HTML版本按需渲染（render_readme_html），这里只取原始markdown
             readme_content, readme_html = self.parser.api_client.get_readme(
                 project_base.owner, 
                 project_base.name,
@@ -59,11 +63,18 @@ class GitHubProcessingService:
             project_base.readme_html = readme_html
             logger.info("README内容获取完成")
             
-            # 3. 提取README中的图片
-            readme_images = self.parser.extract_readme_images(
-                str(request.github_url), 
-                readme_content
-            )
+            # 3. 提取README中的图片（大README放到工作线程扫描，不阻塞事件循环）
+            if len(readme_content) > LARGE_README_THRESHOLD:
+                readme_images = await asyncio.to_thread(
+                    self.parser.extract_readme_images,
+                    str(request.github_url),
+                    readme_content
+                )
+            else:
+                readme_images = self.parser.extract_readme_images(
+                    str(request.github_url), 
+                    readme_content
+                )
             logger.info(f"提取到 {len(readme_images)} 张README图片")
             
             # 4. 截取项目主页截图
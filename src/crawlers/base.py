@@ -1,6 +1,7 @@
 """爬虫基类"""
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import atexit
 import time
 import hashlib
 import requests
@@ -23,6 +24,9 @@ class BaseCrawler(ABC):
         })
         self.crawled_urls = set()
         self.use_playwright = False  # 默认不使用playwright
+        # Playwright浏览器在首次使用时启动，之后各页面复用同一实例
+        self._playwright = None
+        self._browser = None
         
     def get_url_hash(self, url: str) -> str:
         """生成URL哈希"""
@@ -72,18 +76,38 @@ class BaseCrawler(ABC):
             logger.error(f"获取页面失败 {url}: {str(e)}")
         return None
     
-    def _fetch_with_playwright(self, url: str) -> Optional[str]:
-        """使用Playwright获取页面"""
-        try:
+    def _get_browser(self):
+        """获取共享的Playwright浏览器，首次调用时启动"""
+        if self._browser is None:
             from playwright.sync_api import sync_playwright
             
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            atexit.register(self.close)
+        return self._browser
+    
+    def close(self):
+        """关闭共享的Playwright浏览器"""
+        if self._browser is not None:
+            atexit.unregister(self.close)
+            try:
+                self._browser.close()
+                self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"关闭Playwright浏览器失败: {str(e)}")
+            finally:
+                self._browser = None
+                self._playwright = None
+    
+    def _fetch_with_playwright(self, url: str) -> Optional[str]:
+        """使用Playwright获取页面（复用浏览器，每个页面使用独立的上下文）"""
+        try:
             logger.info(f"使用Playwright获取页面: {url}")
             
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent=Config.USER_AGENT
-                )
+            context = self._get_browser().new_context(
+                user_agent=Config.USER_AGENT
+            )
+            try:
                 page = context.new_page()
                 
                 # 访问页面
@@ -94,11 +118,11 @@ class BaseCrawler(ABC):
                 
                 # 获取页面内容
                 html = page.content()
-                
-                browser.close()
-                
-                logger.success(f"Playwright成功获取页面: {url}")
-                return html
+            finally:
+                context.close()
+            
+            logger.success(f"Playwright成功获取页面: {url}")
+            return html
                 
         except Exception as e:
             logger.error(f"Playwright获取页面失败 {url}: {str(e)}")
@@ -167,12 +191,13 @@ class BaseCrawler(ABC):
         """
         pass
     
-    def crawl_article(self, url: str) -> Optional[Article]:
+    def crawl_article(self, url: str, prefer_http: bool = False) -> Optional[Article]:
         """
         爬取单篇文章
         
         Args:
             url: 文章URL
+            prefer_http: 先用普通HTTP请求获取页面，解析不出文章时再用浏览器渲染
             
         Returns:
             Article对象
@@ -181,23 +206,33 @@ class BaseCrawler(ABC):
             logger.info(f"文章已爬取，跳过: {url}")
             return None
         
-        html = self.fetch_page(url)
-        if not html:
-            return None
+        article = None
+        if prefer_http and self.use_playwright:
+            html = self.fetch_page(url, use_playwright=False)
+            if html:
+                article = self.parse_detail(url, html)
+            if not article:
+                logger.info(f"HTTP获取的页面不完整，改用浏览器渲染: {url}")
         
-        article = self.parse_detail(url, html)
+        if not article:
+            html = self.fetch_page(url)
+            if not html:
+                return None
+            
+            article = self.parse_detail(url, html)
         if article:
             logger.success(f"成功爬取文章: {article.title}")
         
         return article
     
-    def crawl_list(self, list_url: str, max_articles: int = 10) -> List[Article]:
+    def crawl_list(self, list_url: str, max_articles: int = 10, prefer_http: bool = False) -> List[Article]:
         """
         爬取列表页的文章
         
         Args:
             list_url: 列表页URL
             max_articles: 最大爬取数量
+            prefer_http: 文章详情页优先用普通HTTP请求获取（见crawl_article）
             
         Returns:
             Article对象列表
@@ -213,7 +248,7 @@ class BaseCrawler(ABC):
         
         articles = []
         for url in article_urls[:max_articles]:
-            article = self.crawl_article(url)
+            article = self.crawl_article(url, prefer_http=prefer_http)
             if article:
                 articles.append(article)
         
@@ -149,14 +149,15 @@ class JiqizhixinCrawler(BaseCrawler):
             logger.error(f"解析文章失败 {url}: {str(e)}")
             return None
     
-    def crawl_latest(self, max_articles: int = 10) -> List[Article]:
+    def crawl_latest(self, max_articles: int = 10, prefer_http: bool = False) -> List[Article]:
         """
         爬取最新文章
         
         Args:
             max_articles: 最大爬取数量
+            prefer_http: 文章详情页优先用普通HTTP请求获取，只有解析失败时才用浏览器渲染
             
         Returns:
             Article对象列表
         """
-        return self.crawl_list(self.list_url, max_articles)
+        return self.crawl_list(self.list_url, max_articles, prefer_http=prefer_http)
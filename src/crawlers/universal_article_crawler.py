@@ -7,6 +7,8 @@ from bs4 import BeautifulSoup
 import json
 import time
 import os
+import shutil
+import hashlib
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 from abc import ABC, abstractmethod
@@ -246,28 +248,46 @@ class ArticleCrawlerManager:
         images_dir = Path(output_dir) / domain.replace('.', '_')
         images_dir.mkdir(parents=True, exist_ok=True)
         
+        # 跨运行的图片缓存，按URL的sha1命名
+        cache_dir = Path(output_dir) / ".cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        
         downloaded_images = []
+        seen = set()
         
         print(f"开始下载 {len(article_data.images)} 张图片...")
         
         for i, img_info in enumerate(article_data.images):
             try:
                 img_url = img_info['url']
+                # 同一CDN地址可能以缩略图、头图、srcset多次出现
+                if img_url in seen:
+                    continue
+                seen.add(img_url)
+                
+                # 生成文件名
+                parsed_url = urlparse(img_url)
+                filename = f"image_{i+1:03d}_{os.path.basename(parsed_url.path)}"
+                if not any(filename.endswith(ext) for ext in ['.jpg', '.png', '.gif', '.webp', '.jpeg']):
+                    filename += '.jpg'
+                
+                filepath = images_dir / filename
+                cache_path = cache_dir / hashlib.sha1(img_url.encode('utf-8')).hexdigest()
+                
+                if cache_path.exists():
+                    shutil.copyfile(cache_path, filepath)
+                    downloaded_images.append(str(filepath))
+                    print(f"  ✓ 命中缓存: {filepath}")
+                    continue
+                
                 print(f"下载图片 {i+1}/{len(article_data.images)}: {img_url}")
                 
                 response = requests.get(img_url, headers=self.crawlers[0].headers, timeout=30)
                 
                 if response.status_code == 200:
-                    # 生成文件名
-                    parsed_url = urlparse(img_url)
-                    filename = f"image_{i+1:03d}_{os.path.basename(parsed_url.path)}"
-                    if not any(filename.endswith(ext) for ext in ['.jpg', '.png', '.gif', '.webp', '.jpeg']):
-                        filename += '.jpg'
-                    
-                    filepath = images_dir / filename
-                    
                     with open(filepath, 'wb') as f:
                         f.write(response.content)
+                    shutil.copyfile(filepath, cache_path)
                     
                     downloaded_images.append(str(filepath))
                     print(f"  ✓ 已保存: {filepath}")
@@ -6,6 +6,8 @@ import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
 import json
+import shutil
+import hashlib
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import time
@@ -212,14 +214,33 @@ class VentureBeatCrawler:
             if download_images and article_data.get('images'):
                 logger.info(f"开始下载 {len(article_data['images'])} 张图片")
                 images_dir = Path("downloaded_images") / urlparse(url).netloc
+                # 跨运行的图片缓存，按URL的sha1命名
+                cache_dir = Path("downloaded_images") / ".cache"
+                cache_dir.mkdir(parents=True, exist_ok=True)
                 downloaded_images = []
+                seen = set()
                 
                 for i, img_info in enumerate(article_data['images']):
                     try:
-                        img_filename = f"image_{i+1:03d}_{Path(urlparse(img_info['url']).path).name}"
+                        img_url = img_info['url']
+                        # 同一CDN地址可能以缩略图、头图、srcset多次出现
+                        if img_url in seen:
+                            continue
+                        seen.add(img_url)
+                        
+                        img_filename = f"image_{i+1:03d}_{Path(urlparse(img_url).path).name}"
                         img_path = images_dir / img_filename
+                        cache_path = cache_dir / hashlib.sha1(img_url.encode('utf-8')).hexdigest()
+                        
+                        if cache_path.exists():
+                            img_path.parent.mkdir(parents=True, exist_ok=True)
+                            shutil.copyfile(cache_path, img_path)
+                            logger.info(f"图片命中缓存: {img_path}")
+                            downloaded_images.append(str(img_path))
+                            continue
                         
-                        if await self.download_image(img_info['url'], img_path):
+                        if await self.download_image(img_url, img_path):
+                            shutil.copyfile(img_path, cache_path)
                             downloaded_images.append(str(img_path))
                             
                     except Exception as e:
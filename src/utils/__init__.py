@@ -2,12 +2,12 @@
 from src.utils.logger import logger
 from src.utils.config import Config
 from src.utils.github_parser import (
-    GitHubUrlParser, GitHubAPIClient, 
+    GitHubUrlInfo, GitHubUrlParser, GitHubAPIClient, 
     ReadmeImageExtractor, GitHubProjectParser
 )
 
 __all__ = [
     'logger', 'Config',
-    'GitHubUrlParser', 'GitHubAPIClient',
+    'GitHubUrlInfo', 'GitHubUrlParser', 'GitHubAPIClient',
     'ReadmeImageExtractor', 'GitHubProjectParser'
 ]
@@ -2,21 +2,231 @@
 GitHub项目解析工具
 负责解析GitHub项目信息、README内容和图片链接
 """
+import os
 import re
+import json
+import time
+import atexit
+import base64
+import functools
+import threading
+from collections import OrderedDict
 import requests
-from typing import List, Tuple, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 from loguru import logger
 from src.models.github_models import GitHubProjectBase, ProjectImage
+from src.utils.config import Config
 from datetime import datetime
 
 
+# README图片匹配正则（模块级预编译，避免每次调用重复解析）
+# 单次扫描同时定位 "![" 和 "<img" 两类候选位置，再在候选处用锚定正则解析，不在全文上回溯
+_IMG_START_RE = re.compile(r'(?P<md>!\[)|(?P<html><img)', re.IGNORECASE)
+_MD_URL_RE = re.compile(r'[^)\s]+')
+_MD_TITLE_RE = re.compile(r'\s+"([^"]*)"\)')
+# 一次匹配同时取出src和（可选的）alt属性
+_HTML_IMG_RE = re.compile(
+    r'<img(?=[^>]+src=["\']([^"\']+)["\'][^>]*>)(?:[^>]*?alt=["\']([^"\'>]*)["\'])?[^>]*>',
+    re.IGNORECASE
+)
+
+# GraphQL批量查询仓库信息时每个仓库请求的字段
+_REPO_GRAPHQL_FIELDS = (
+    "name nameWithOwner description stargazerCount forkCount "
+    "createdAt updatedAt "
+    "defaultBranchRef { name } primaryLanguage { name }"
+)
+
+# 无需补全的绝对URL前缀
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://')
+
+
+def _parse_markdown_image(text: str, start: int) -> Tuple[Optional[Tuple[str, str, str]], int]:
+    """
+    从start处的 "![" 解析Markdown图片: ![alt](url) 或 ![alt](url "title")
+    返回: ((alt, url, title) 或 None, 下一个可能匹配的位置)
+    """
+    close = text.find(']', start + 2)
+    if close == -1:
+        # 之后不再有 "]"，不可能再有匹配
+        return None, len(text)
+    # 失败时 (start, close) 之间的其他 "![" 也会在同一个 "]" 处失败，直接跳过
+    if not text.startswith('(', close + 1):
+        return None, close + 1
+    url_match = _MD_URL_RE.match(text, close + 2)
+    if not url_match:
+        return None, close + 1
+    end = url_match.end()
+    if text.startswith(')', end):
+        return (text[start + 2:close], url_match.group(0), ""), end + 1
+    title_match = _MD_TITLE_RE.match(text, end)
+    if title_match:
+        return (text[start + 2:close], url_match.group(0), title_match.group(1)), title_match.end()
+    return None, close + 1
+
+
+def _scan_readme_images(text: str) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str]]]:
+    """
+    单次扫描README中的Markdown图片和HTML img标签
+    返回: ([(alt, url, title)], [(url, alt)])
+    """
+    md_images = []
+    html_images = []
+    
+    # 两类图片各自维护扫描进度，与分别扫描两遍的结果一致
+    md_next = html_next = 0
+    for match in _IMG_START_RE.finditer(text):
+        start = match.start()
+        if match.lastgroup == 'html':
+            if start < html_next:
+                continue
+            html_match = _HTML_IMG_RE.match(text, start)
+            if html_match:
+                html_images.append((html_match.group(1), html_match.group(2) or ""))
+                html_next = html_match.end()
+        elif start >= md_next:
+            image, md_next = _parse_markdown_image(text, start)
+            if image:
+                md_images.append(image)
+    
+    return md_images, html_images
+
+
+class _LRUCache:
+    """进程内LRU缓存，可选过期时间（秒）"""
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[tuple, Tuple[Optional[float], object]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple):
+        """命中返回缓存值，未命中或已过期返回None"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: tuple, value):
+        with self._lock:
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _ETagCache:
+    """
+    URL -> (ETag, 响应内容) 的LRU缓存
+    首次使用时从磁盘加载，之后只在save()时写回一次（临时文件+重命名，保证原子性）
+    """
+    
+    def __init__(self, path: Path, maxsize: int):
+        self.path = path
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+    
+    def _read_file(self) -> "OrderedDict[str, Tuple[str, bytes]]":
+        """读取磁盘上的缓存，文件不存在或损坏时返回空字典"""
+        try:
+            raw = json.loads(self.path.read_text(encoding='utf-8'))
+            return OrderedDict(
+                (url, (etag, base64.b64decode(body))) for url, (etag, body) in raw.items()
+            )
+        except FileNotFoundError:
+            return OrderedDict()
+        except Exception as e:
+            logger.warning(f"加载ETag缓存失败: {e}")
+            return OrderedDict()
+    
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._loaded = True
+            self._data = self._read_file()
+            self._trim()
+    
+    def _trim(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            self._ensure_loaded()
+            item = self._data.get(url)
+            if item is not None:
+                self._data.move_to_end(url)
+            return item
+    
+    def put(self, url: str, etag: str, body: bytes):
+        with self._lock:
+            self._ensure_loaded()
+            self._data[url] = (etag, body)
+            self._data.move_to_end(url)
+            self._trim()
+            self._dirty = True
+    
+    def save(self):
+        """把本进程新增的条目合并进磁盘文件后原子替换"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                # 先合并其他进程写入的条目，本进程的条目更新，放在后面
+                merged = self._read_file()
+                for url, item in self._data.items():
+                    merged.pop(url, None)
+                    merged[url] = item
+                while len(merged) > self.maxsize:
+                    merged.popitem(last=False)
+                
+                payload = {
+                    url: (etag, base64.b64encode(body).decode('ascii'))
+                    for url, (etag, body) in merged.items()
+                }
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(payload), encoding='utf-8')
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"保存ETag缓存失败: {e}")
+
+
+class GitHubUrlInfo(NamedTuple):
+    """GitHub URL解析结果（不可变，可被缓存）"""
+    owner: str
+    repo: str
+    full_url: str
+    api_url: str
+    raw_url: str
+
+
 class GitHubUrlParser:
     """GitHub URL解析器"""
     
     @staticmethod
-    def parse_github_url(url: str) -> dict:
+    @functools.lru_cache(maxsize=4096)
+    def parse_github_url(url: str) -> GitHubUrlInfo:
         """
         解析GitHub URL，提取owner和repo信息
         支持多种URL格式:
@@ -35,18 +245,30 @@ class GitHubUrlParser:
         owner = path_parts[0]
         repo = path_parts[1].replace('.git', '')
         
-        return {
-            'owner': owner,
-            'repo': repo,
-            'full_url': f"https://github.com/{owner}/{repo}",
-            'api_url': f"https://api.github.com/repos/{owner}/{repo}",
-            'raw_url': f"https://raw.githubusercontent.com/{owner}/{repo}"
-        }
+        return GitHubUrlInfo(
+            owner=owner,
+            repo=repo,
+            full_url=f"https://github.com/{owner}/{repo}",
+            api_url=f"https://api.github.com/repos/{owner}/{repo}",
+            raw_url=f"https://raw.githubusercontent.com/{owner}/{repo}"
+        )
 
 
 class GitHubAPIClient:
     """GitHub API客户端"""
     
+    # ETag缓存（所有实例共享），跨运行复用，未变化的资源返回304不消耗速率限制
+    # 进程退出或close()时写回磁盘一次
+    ETAG_CACHE_PATH = Config.DATA_DIR / "cache" / "github_etag.json"
+    ETAG_CACHE_SIZE = 256
+    _etag_cache = _ETagCache(ETAG_CACHE_PATH, ETAG_CACHE_SIZE)
+    atexit.register(_etag_cache.save)
+    
+    # 进程内缓存（所有实例共享），键包含token以区分访问权限
+    # README设置过期时间，长时间运行的服务能拿到新提交
+    _repo_info_cache = _LRUCache(maxsize=512)
+    _readme_cache = _LRUCache(maxsize=512, ttl=900)
+    
     def __init__(self, token: Optional[str] = None):
         self.token = token
         self.headers = {
@@ -55,23 +277,142 @@ class GitHubAPIClient:
         }
         if token:
             self.headers['Authorization'] = f'token {token}'
+        
+        # 复用连接池，避免每次请求重新建立TCP+TLS连接
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.headers)
+        
+        # 本地markdown渲染器，首次渲染时创建
+        self._md_renderer = None
+    
+    def close(self):
+        """写回ETag缓存并关闭连接池"""
+        self._etag_cache.save()
+        self.session.close()
+    
+    def _conditional_get(self, url: str) -> bytes:
+        """带If-None-Match的GET请求，304时返回缓存内容"""
+        cached = self._etag_cache.get(url)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            logger.debug(f"ETag命中: {url}")
+            return cached[1]
+        response.raise_for_status()
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache.put(url, etag, response.content)
+        return response.content
+    
+    @classmethod
+    def clear_cache(cls):
+        """清空进程内的仓库信息和README缓存"""
+        cls._repo_info_cache.clear()
+        cls._readme_cache.clear()
     
     def get_repo_info(self, owner: str, repo: str) -> dict:
         """获取仓库基本信息"""
+        cache_key = (self.token, owner, repo)
+        cached = self._repo_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         url = f"https://api.github.com/repos/{owner}/{repo}"
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            repo_data = json.loads(self._conditional_get(url))
         except requests.RequestException as e:
             logger.error(f"获取仓库信息失败: {e}")
             raise
+        
+        self._repo_info_cache.put(cache_key, repo_data)
+        return repo_data
+    
+    def get_repos_info_batch(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        """
+        通过一次GraphQL请求批量获取仓库基本信息
+        返回: {(owner, repo): 与REST接口字段一致的仓库信息}
+        """
+        result = {}
+        missing = []
+        for owner, repo in pairs:
+            cached = self._repo_info_cache.get((self.token, owner, repo))
+            if cached is not None:
+                result[(owner, repo)] = cached
+            else:
+                missing.append((owner, repo))
+        
+        if not missing:
+            return result
+        
+        # GraphQL接口必须带token，未配置时退回逐个REST请求
+        if not self.token:
+            for owner, repo in missing:
+                result[(owner, repo)] = self.get_repo_info(owner, repo)
+            return result
+        
+        params = []
+        fields = []
+        variables = {}
+        for i, (owner, repo) in enumerate(missing):
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_REPO_GRAPHQL_FIELDS} }}")
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+        query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+        
+        try:
+            response = self.session.post(
+                "https://api.github.com/graphql",
+                json={"query": query, "variables": variables},
+                timeout=10
+            )
+            response.raise_for_status()
+            data = response.json().get('data') or {}
+        except requests.RequestException as e:
+            logger.error(f"批量获取仓库信息失败: {e}")
+            raise
+        
+        for i, (owner, repo) in enumerate(missing):
+            node = data.get(f"r{i}")
+            if not node:
+                # 与REST接口的404保持同一异常类型，调用方的异常处理不变
+                raise requests.HTTPError(f"仓库不存在或无权访问: {owner}/{repo}")
+            repo_data = {
+                'name': node['name'],
+                'full_name': node['nameWithOwner'],
+                'description': node.get('description'),
+                'language': (node.get('primaryLanguage') or {}).get('name'),
+                'stargazers_count': node.get('stargazerCount', 0),
+                'forks_count': node.get('forkCount', 0),
+                # REST接口的watchers_count历史上等同于star数（订阅者数是subscribers_count）
+                'watchers_count': node.get('stargazerCount', 0),
+                'created_at': node['createdAt'],
+                'updated_at': node['updatedAt'],
+                'default_branch': (node.get('defaultBranchRef') or {}).get('name', 'main'),
+            }
+            self._repo_info_cache.put((self.token, owner, repo), repo_data)
+            result[(owner, repo)] = repo_data
+        return result
     
-    def get_readme(self, owner: str, repo: str, branch: str = 'main') -> Tuple[str, str]:
+    def get_readme(self, owner: str, repo: str, branch: str = 'main') -> Tuple[str, Optional[str]]:
         """
         获取README内容
-        返回: (原始markdown内容, HTML内容)
+        返回: (原始markdown内容, None)
+        HTML版本不再预先渲染，需要时调用 render_readme_html
         """
+        cache_key = (self.token, owner, repo, branch)
+        cached = self._readme_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # 尝试不同的README文件名
         readme_names = ['README.md', 'readme.md', 'Readme.md']
         
@@ -79,41 +420,58 @@ class GitHubAPIClient:
             try:
                 # 先尝试获取README文件信息
                 contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{readme_name}?ref={branch}"
-                response = requests.get(contents_url, headers=self.headers, timeout=10)
+                # 只确认文件存在：用HEAD不下载内容，也不写入ETag缓存；不存在时抛出HTTPError，进入下一个文件名
+                self.session.head(contents_url, timeout=10, allow_redirects=True).raise_for_status()
                 
-                if response.status_code == 200:
-                    # 获取原始README内容
-                    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{readme_name}"
-                    raw_response = requests.get(raw_url, timeout=10)
-                    raw_response.raise_for_status()
-                    
-                    # 获取HTML渲染版本
-                    html_url = f"https://api.github.com/markdown"
-                    html_response = requests.post(
-                        html_url,
-                        json={
-                            "text": raw_response.text,
-                            "mode": "gfm",
-                            "context": f"{owner}/{repo}"
-                        },
-                        headers=self.headers,
-                        timeout=10
-                    )
-                    
-                    html_content = html_response.text if html_response.status_code == 200 else ""
-                    
-                    return raw_response.text, html_content
+                # 获取原始README内容
+                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{readme_name}"
+                raw_text = self._conditional_get(raw_url).decode('utf-8', errors='replace')
+                
+                self._readme_cache.put(cache_key, (raw_text, None))
+                return raw_text, None
                     
             except requests.RequestException as e:
                 logger.debug(f"尝试 {readme_name} 失败: {e}")
                 continue
         
         raise FileNotFoundError("未找到README文件")
+    
+    def render_readme_html(self, owner: str, repo: str, markdown_content: str) -> str:
+        """
+        将README渲染为HTML
+        优先使用本地markdown-it-py渲染，未安装时调用GitHub markdown接口
+        """
+        try:
+            from markdown_it import MarkdownIt
+            if self._md_renderer is None:
+                # commonmark + GFM表格/删除线；gfm-like预设的linkify还依赖linkify-it-py
+                self._md_renderer = MarkdownIt('commonmark').enable(['table', 'strikethrough'])
+            return self._md_renderer.render(markdown_content)
+        except ImportError:
+            logger.debug("markdown-it-py未安装，使用GitHub接口渲染README")
+        
+        try:
+            html_response = self.session.post(
+                "https://api.github.com/markdown",
+                json={
+                    "text": markdown_content,
+                    "mode": "gfm",
+                    "context": f"{owner}/{repo}"
+                },
+                timeout=10
+            )
+            return html_response.text if html_response.status_code == 200 else ""
+        except requests.RequestException as e:
+            logger.warning(f"渲染README失败: {e}")
+            return ""
 
 
 class ReadmeImageExtractor:
     """README图片提取器"""
     
+    # 每个README创建一个实例，用__slots__省去实例字典
+    __slots__ = ('base_url', 'owner', 'repo', 'branch', 'raw_base_url')
+    
     def __init__(self, base_url: str, owner: str, repo: str, branch: str = 'main'):
         self.base_url = base_url
         self.owner = owner
@@ -125,15 +483,10 @@ class ReadmeImageExtractor:
         """从Markdown内容中提取图片链接"""
         images = []
         
-        # 1. 匹配Markdown图片语法: ![alt](url) 或 ![alt](url "title")
-        md_pattern = r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)'
-        md_matches = re.finditer(md_pattern, markdown_content)
+        md_images, html_images = _scan_readme_images(markdown_content)
         
-        for i, match in enumerate(md_matches):
-            alt_text = match.group(1) or ""
-            image_url = match.group(2)
-            title = match.group(3) or ""
-            
+        # 1. Markdown图片语法: ![alt](url) 或 ![alt](url "title")
+        for i, (alt_text, image_url, title) in enumerate(md_images):
             # 处理相对路径和绝对路径
             full_url = self._resolve_image_url(image_url)
             
@@ -146,17 +499,8 @@ class ReadmeImageExtractor:
                 )
                 images.append(image)
         
-        # 2. 匹配HTML img标签
-        html_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-        html_matches = re.finditer(html_pattern, markdown_content, re.IGNORECASE)
-        
-        for i, match in enumerate(html_matches):
-            image_url = match.group(1)
-            
-            # 提取alt属性（如果存在）
-            alt_match = re.search(r'alt=["\']([^"\']*)["\']', match.group(0), re.IGNORECASE)
-            alt_text = alt_match.group(1) if alt_match else ""
-            
+        # 2. HTML img标签
+        for i, (image_url, alt_text) in enumerate(html_images):
             # 处理相对路径和绝对路径
             full_url = self._resolve_image_url(image_url)
             
@@ -174,7 +518,7 @@ class ReadmeImageExtractor:
     def _resolve_image_url(self, url: str) -> Optional[str]:
         """解析并补全图片URL"""
         # 如果已经是完整URL
-        if url.startswith(('http://', 'https://')):
+        if url.startswith(_ABSOLUTE_URL_PREFIXES):
             return url
         
         # 处理相对路径
@@ -196,33 +540,41 @@ class GitHubProjectParser:
     
     def parse_project(self, github_url: str) -> GitHubProjectBase:
         """解析完整的GitHub项目信息"""
+        return self.parse_projects([github_url])[0]
+    
+    def parse_projects(self, github_urls: List[str]) -> List[GitHubProjectBase]:
+        """批量解析GitHub项目信息，仓库信息只请求一次"""
         # 解析URL
-        url_info = GitHubUrlParser.parse_github_url(github_url)
+        url_infos = [GitHubUrlParser.parse_github_url(url) for url in github_urls]
         
         # 获取仓库信息
-        repo_data = self.api_client.get_repo_info(
-            url_info['owner'], 
-            url_info['repo']
+        repos_data = self.api_client.get_repos_info_batch(
+            [(info.owner, info.repo) for info in url_infos]
         )
         
-        # 创建项目基础信息对象
-        project = GitHubProjectBase(
-            id=f"{url_info['owner']}_{url_info['repo']}",
-            url=url_info['full_url'],
-            name=repo_data['name'],
-            full_name=repo_data['full_name'],
-            description=repo_data.get('description'),
-            language=repo_data.get('language'),
-            stars=repo_data.get('stargazers_count', 0),
-            forks=repo_data.get('forks_count', 0),
-            watchers=repo_data.get('watchers_count', 0),
-            created_at=datetime.fromisoformat(repo_data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(repo_data['updated_at'].replace('Z', '+00:00')),
-            owner=url_info['owner'],
-            default_branch=repo_data.get('default_branch', 'main')
-        )
+        projects = []
+        for url_info in url_infos:
+            repo_data = repos_data[(url_info.owner, url_info.repo)]
+            
+            # 创建项目基础信息对象
+            project = GitHubProjectBase(
+                id=f"{url_info.owner}_{url_info.repo}",
+                url=url_info.full_url,
+                name=repo_data['name'],
+                full_name=repo_data['full_name'],
+                description=repo_data.get('description'),
+                language=repo_data.get('language'),
+                stars=repo_data.get('stargazers_count', 0),
+                forks=repo_data.get('forks_count', 0),
+                watchers=repo_data.get('watchers_count', 0),
+                created_at=datetime.fromisoformat(repo_data['created_at'].replace('Z', '+00:00')),
+                updated_at=datetime.fromisoformat(repo_data['updated_at'].replace('Z', '+00:00')),
+                owner=url_info.owner,
+                default_branch=repo_data.get('default_branch', 'main')
+            )
+            projects.append(project)
         
-        return project
+        return projects
     
     def extract_readme_images(self, github_url: str, markdown_content: str) -> List[ProjectImage]:
         """提取README中的图片"""
@@ -230,8 +582,8 @@ class GitHubProjectParser:
         
         extractor = ReadmeImageExtractor(
             github_url,
-            url_info['owner'],
-            url_info['repo'],
+            url_info.owner,
+            url_info.repo,
             'main'  # 默认分支
         )
         
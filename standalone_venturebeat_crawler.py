@@ -2,15 +2,73 @@
 独立的VentureBeat文章爬虫测试
 无需依赖项目其他模块
 """
-import requests
-from bs4 import BeautifulSoup
-import json
-import time
-import os
-from urllib.parse import urljoin, urlparse
+import asyncio
+import aiohttp
+import lxml.html
+from lxml import etree
+import orjson
+from functools import lru_cache
+from urllib.parse import urljoin
 from pathlib import Path
 
-def crawl_venturebeat_article(url):
+# 每个主机的并发连接数（页面和图片共用一个会话）
+MAX_CONNECTIONS_PER_HOST = 8
+# 流式下载的块大小
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# 可直接保存的图片扩展名
+IMG_EXT_SET = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp'})
+
+
+def _has_class(name):
+    """XPath: class属性中包含完整的类名（等价于CSS的 .name）"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# XPath查询在模块加载时编译一次，按优先级排列
+TITLE_XP = etree.XPath('(//h1)[1]')
+AUTHOR_XPS = [
+    etree.XPath('//*[contains(@class, "author")]//a'),
+    etree.XPath('//*[@rel="author"]'),
+    etree.XPath(f'//*[{_has_class("byline-author")}]'),
+]
+TIME_XP = etree.XPath('(//time)[1]')
+CONTENT_XPS = [
+    etree.XPath('//*[contains(@class, "content")]'),
+    etree.XPath('//article'),
+    etree.XPath(f'//*[{_has_class("post-content")}]'),
+]
+UNWANTED_XP = etree.XPath(
+    'descendant::script | descendant::style | descendant::nav'
+    f' | descendant::*[{_has_class("ad")} or {_has_class("advertisement")} or {_has_class("related-posts")}]'
+)
+IMG_XP = etree.XPath('//img')
+TAG_XPS = [
+    etree.XPath(f'//*[{_has_class("tags")}]//a'),
+    etree.XPath(f'//*[{_has_class("post-tags")}]//a'),
+    etree.XPath('//*[@rel="tag"]'),
+]
+SUMMARY_XP = etree.XPath('(//meta[@name="description"])[1]/@content')
+
+def _text(elem, separator=''):
+    """拼接元素下所有非空文本片段（与BeautifulSoup的get_text(strip=True)一致）"""
+    return separator.join(t.strip() for t in elem.itertext() if t.strip())
+
+@lru_cache(maxsize=1024)
+def image_basename(img_url):
+    """取图片URL路径中的文件名，没有图片扩展名时补上.jpg"""
+    path = img_url.split('#', 1)[0].split('?', 1)[0]
+    if '//' in path:
+        path = path.split('//', 1)[1].partition('/')[2]
+    name = path.rsplit('/', 1)[-1]
+    if name.rpartition('.')[2].lower() not in IMG_EXT_SET:
+        name += '.jpg'
+    return name
+
+def parse_html(content, charset=None):
+    """用lxml解析页面，响应头声明了编码时跳过编码探测"""
+    parser = lxml.html.HTMLParser(encoding=charset)
+    return lxml.html.fromstring(content, parser=parser)
+
+async def crawl_venturebeat_article(url):
     """抓取VentureBeat文章"""
     
     print(f"🚀 开始抓取VentureBeat文章: {url}")
@@ -26,108 +84,117 @@ def crawl_venturebeat_article(url):
         'Upgrade-Insecure-Requests': '1',
     }
     
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST)
+    timeout = aiohttp.ClientTimeout(total=30)
+    
     try:
-        # 发送请求
-        print("正在发送请求...")
-        time.sleep(2)
-        response = requests.get(url, headers=headers, timeout=30)
-        
-        if response.status_code == 200:
-            print("✅ 请求成功!")
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 提取文章信息
-            article_data = {
-                'url': url,
-                'title': extract_title(soup),
-                'author': extract_author(soup),
-                'publish_date': extract_publish_date(soup),
-                'content': extract_content(soup),
-                'images': extract_images(soup, url),
-                'tags': extract_tags(soup),
-                'summary': extract_summary(soup)
-            }
-            
-            # 显示结果
-            print("\n📋 文章信息:")
-            print(f"标题: {article_data['title']}")
-            print(f"作者: {article_data['author']}")
-            print(f"发布日期: {article_data['publish_date']}")
-            print(f"内容长度: {len(article_data['content'])} 字符")
-            print(f"图片数量: {len(article_data['images'])}")
-            print(f"标签: {', '.join(article_data['tags']) if article_data['tags'] else '无标签'}")
-            print(f"摘要: {article_data['summary'][:150]}...")
-            
-            # 显示图片信息
-            if article_data['images']:
-                print("\n🖼️  图片列表:")
-                for i, img in enumerate(article_data['images'][:5]):
-                    print(f"  {i+1}. {img['alt'][:50]} -> {img['url'][:80]}...")
-            
-            # 保存原始数据
-            with open('venturebeat_article_raw.json', 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, ensure_ascii=False, indent=2, default=str)
-            print(f"\n💾 原始数据已保存到 venturebeat_article_raw.json")
-            
-            # 下载图片
-            downloaded_images = download_article_images(article_data)
-            article_data['downloaded_images'] = downloaded_images
-            
-            # 保存完整数据
-            with open('venturebeat_article_complete.json', 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, ensure_ascii=False, indent=2, default=str)
-            print(f"💾 完整数据已保存到 venturebeat_article_complete.json")
-            
-            return article_data
-            
-        else:
-            print(f"❌ HTTP错误: {response.status_code}")
-            return None
-            
+        # 页面和图片复用同一个会话的连接
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            return await _crawl_with_session(session, url)
     except Exception as e:
         print(f"❌ 抓取失败: {e}")
         return None
 
-def extract_title(soup):
+async def _crawl_with_session(session, url):
+    """使用给定会话抓取文章并下载图片"""
+    # 发送请求
+    print("正在发送请求...")
+    async with session.get(url) as response:
+        status = response.status
+        charset = response.charset
+        content = await response.read()
+    
+    if status != 200:
+        print(f"❌ HTTP错误: {status}")
+        return None
+    
+    print("✅ 请求成功!")
+    doc = parse_html(content, charset)
+    
+    # 提取文章信息
+    article_data = {
+        'url': url,
+        'title': extract_title(doc),
+        'author': extract_author(doc),
+        'publish_date': extract_publish_date(doc),
+        'content': extract_content(doc),
+        'images': extract_images(doc, url),
+        'tags': extract_tags(doc),
+        'summary': extract_summary(doc)
+    }
+    
+    # 显示结果
+    print("\n📋 文章信息:")
+    print(f"标题: {article_data['title']}")
+    print(f"作者: {article_data['author']}")
+    print(f"发布日期: {article_data['publish_date']}")
+    print(f"内容长度: {len(article_data['content'])} 字符")
+    print(f"图片数量: {len(article_data['images'])}")
+    print(f"标签: {', '.join(article_data['tags']) if article_data['tags'] else '无标签'}")
+    print(f"摘要: {article_data['summary'][:150]}...")
+    
+    # 显示图片信息
+    if article_data['images']:
+        print("\n🖼️  图片列表:")
+        for i, img in enumerate(article_data['images'][:5]):
+            print(f"  {i+1}. {img['alt'][:50]} -> {img['url'][:80]}...")
+    
+    # 保存原始数据
+    Path('venturebeat_article_raw.json').write_bytes(
+        orjson.dumps(article_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    )
+    print(f"\n💾 原始数据已保存到 venturebeat_article_raw.json")
+    
+    # 下载图片
+    downloaded_images = await download_article_images(session, article_data)
+    article_data['downloaded_images'] = downloaded_images
+    
+    # 保存完整数据
+    Path('venturebeat_article_complete.json').write_bytes(
+        orjson.dumps(article_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    )
+    print(f"💾 完整数据已保存到 venturebeat_article_complete.json")
+    
+    return article_data
+
+def extract_title(doc):
     """提取标题"""
-    title_elem = soup.find('h1')
-    return title_elem.get_text(strip=True) if title_elem else "未找到标题"
+    title_elems = TITLE_XP(doc)
+    return _text(title_elems[0]) if title_elems else "未找到标题"
 
-def extract_author(soup):
+def extract_author(doc):
     """提取作者"""
-    author_selectors = ['[class*="author"] a', '[rel="author"]', '.byline-author']
-    for selector in author_selectors:
-        author_elem = soup.select_one(selector)
-        if author_elem:
-            return author_elem.get_text(strip=True)
+    for xpath in AUTHOR_XPS:
+        author_elems = xpath(doc)
+        if author_elems:
+            return _text(author_elems[0])
     return "未知作者"
 
-def extract_publish_date(soup):
+def extract_publish_date(doc):
     """提取发布日期"""
-    time_elem = soup.find('time')
-    if time_elem and time_elem.has_attr('datetime'):
-        return time_elem['datetime']
+    time_elems = TIME_XP(doc)
+    if time_elems and time_elems[0].get('datetime') is not None:
+        return time_elems[0].get('datetime')
     return "未知日期"
 
-def extract_content(soup):
+def extract_content(doc):
     """提取文章内容"""
-    content_selectors = ['[class*="content"]', 'article', '.post-content']
-    for selector in content_selectors:
-        content_elem = soup.select_one(selector)
-        if content_elem:
+    for xpath in CONTENT_XPS:
+        content_elems = xpath(doc)
+        if content_elems:
+            content_elem = content_elems[0]
             # 清理不需要的元素
-            for unwanted in content_elem.select('script, style, .ad, .advertisement, .related-posts, nav'):
-                unwanted.decompose()
-            content_text = content_elem.get_text(separator='\n', strip=True)
+            for unwanted in UNWANTED_XP(content_elem):
+                unwanted.drop_tree()
+            content_text = _text(content_elem, '\n')
             return content_text[:3000] + "..." if len(content_text) > 3000 else content_text
     return "未找到文章内容"
 
-def extract_images(soup, base_url):
+def extract_images(doc, base_url):
     """提取图片信息"""
     images = []
-    img_elements = soup.find_all('img')
     
-    for img in img_elements:
+    for img in IMG_XP(doc):
         src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
         if src:
             full_url = urljoin(base_url, src)
@@ -139,27 +206,22 @@ def extract_images(soup, base_url):
             })
     return images
 
-def extract_tags(soup):
+def extract_tags(doc):
     """提取标签"""
     tags = []
-    tag_selectors = ['.tags a', '.post-tags a', '[rel="tag"]']
-    
-    for selector in tag_selectors:
-        tag_elements = soup.select(selector)
-        for tag in tag_elements:
-            tag_text = tag.get_text(strip=True)
+    for xpath in TAG_XPS:
+        for tag in xpath(doc):
+            tag_text = _text(tag)
             if tag_text and tag_text not in tags:
                 tags.append(tag_text)
     return tags
 
-def extract_summary(soup):
+def extract_summary(doc):
     """提取摘要"""
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
-    if meta_desc:
-        return meta_desc.get('content', '')
-    return ""
+    meta_content = SUMMARY_XP(doc)
+    return meta_content[0] if meta_content else ""
 
-def download_article_images(article_data, output_dir="downloaded_images"):
+async def download_article_images(session, article_data, output_dir="downloaded_images"):
     """下载文章图片"""
     if not article_data or not article_data.get('images'):
         print("没有图片需要下载")
@@ -169,46 +231,44 @@ def download_article_images(article_data, output_dir="downloaded_images"):
     images_dir = Path(output_dir) / "venturebeat_final"
     images_dir.mkdir(parents=True, exist_ok=True)
     
-    downloaded_images = []
-    
-    print(f"\n📥 开始下载图片 ({len(article_data['images'])} 张)...")
+    images = article_data['images']
+    print(f"\n📥 开始下载图片 ({len(images)} 张)...")
     
-    for i, img_info in enumerate(article_data['images']):
+    async def _fetch(i, img_info):
         try:
             img_url = img_info['url']
-            print(f"下载图片 {i+1}/{len(article_data['images'])}: {img_info['alt'][:30]}...")
+            print(f"下载图片 {i+1}/{len(images)}: {img_info['alt'][:30]}...")
             
-            # 发送请求下载图片
-            response = requests.get(img_url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }, timeout=30)
-            
-            if response.status_code == 200:
-                # 生成文件名
-                parsed_url = urlparse(img_url)
-                filename = f"article_image_{i+1:03d}_{os.path.basename(parsed_url.path)}"
-                if not any(filename.endswith(ext) for ext in ['.jpg', '.png', '.gif', '.webp', '.jpeg']):
-                    filename += '.jpg'
-                
-                filepath = images_dir / filename
+            # 发送请求下载图片，流式读取避免整张图片驻留内存
+            async with session.get(img_url) as response:
+                if response.status == 200:
+                    # 按输入位置生成文件名，保证结果确定
+                    filename = f"article_image_{i+1:03d}_{image_basename(img_url)}"
+                    filepath = images_dir / filename
+                    
+                    # 保存图片
+                    with open(filepath, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    
+                    file_size = filepath.stat().st_size / 1024  # KB
+                    print(f"  ✓ 已保存 ({file_size:.1f} KB): {filepath.name}")
+                    return i, str(filepath)
+                else:
+                    print(f"  ✗ 下载失败，状态码: {response.status}")
                 
-                # 保存图片
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                downloaded_images.append(str(filepath))
-                file_size = filepath.stat().st_size / 1024  # KB
-                print(f"  ✓ 已保存 ({file_size:.1f} KB): {filepath.name}")
-            else:
-                print(f"  ✗ 下载失败，状态码: {response.status_code}")
-                
-            time.sleep(1)  # 避免请求过于频繁
-            
         except Exception as e:
             print(f"  ✗ 下载异常: {e}")
-            continue
+        return i, None
+    
+    # 并发下载，谁先完成先落盘；结果按输入顺序返回
+    results = [None] * len(images)
+    tasks = [_fetch(i, img_info) for i, img_info in enumerate(images)]
+    for next_done in asyncio.as_completed(tasks):
+        i, path = await next_done
+        results[i] = path
     
-    return downloaded_images
+    return [path for path in results if path]
 
 def main():
     """主函数"""
@@ -216,7 +276,7 @@ def main():
     url = "https://venturebeat.com/orchestration/new-agent-framework-matches-human-engineered-ai-systems-and-adds-zero"
     
     # 执行爬取
-    article_data = crawl_venturebeat_article(url)
+    article_data = asyncio.run(crawl_venturebeat_article(url))
     
     if article_data:
         print("\n🎉 文章抓取完成!")
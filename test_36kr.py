@@ -1,12 +1,14 @@
 """测试36kr AI频道"""
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 
 url = "https://www.36kr.com/information/AI/"
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
+ARTICLE_LINK_FILTER = "contains(@href, '/p/') or contains(@href, '/newsflashes/')"
+
 print(f"测试访问: {url}")
 
 try:
@@ -14,22 +16,20 @@ try:
     print(f"✅ 状态码: {r.status_code}")
     print(f"内容长度: {len(r.text)} 字符")
     
-    soup = BeautifulSoup(r.text, 'lxml')
-    print(f"标题: {soup.title.string if soup.title else '无'}")
+    # 直接解析字节，省去requests对r.text的编码猜测
+    tree = lxml.html.fromstring(r.content)
+    title = tree.findtext('.//title')
+    print(f"标题: {title if title else '无'}")
     
     # 查找文章链接
-    links = soup.find_all('a', href=True)
-    print(f"\n总链接数: {len(links)}")
+    print(f"\n总链接数: {int(tree.xpath('count(//a[@href])'))}")
     
     # 查找包含 /p/ 的文章链接
-    article_links = []
-    for link in links:
-        href = link.get('href', '')
-        if '/p/' in href or '/newsflashes/' in href:
-            if href.startswith('/'):
-                href = 'https://www.36kr.com' + href
-            if href not in article_links:
-                article_links.append(href)
+    hrefs = tree.xpath(f"//a[{ARTICLE_LINK_FILTER}]/@href")
+    article_links = list(dict.fromkeys(
+        'https://www.36kr.com' + href if href.startswith('/') else href
+        for href in hrefs
+    ))
     
     print(f"文章链接数: {len(article_links)}")
     print("\n前10个文章链接:")
@@ -38,10 +38,9 @@ try:
     
     # 显示一些链接的标题
     print("\n前5个链接的标题:")
-    for link_elem in links[:20]:
-        text = link_elem.get_text(strip=True)
-        href = link_elem.get('href', '')
-        if text and len(text) > 10 and ('/p/' in href or '/newsflashes/' in href):
+    for link_elem in tree.xpath(f"(//a[@href])[position() <= 20][{ARTICLE_LINK_FILTER}]"):
+        text = link_elem.text_content().strip()
+        if text and len(text) > 10:
             print(f"  - {text[:60]}")
 
 except Exception as e:
@@ -1,11 +1,60 @@
 """完整测试36kr爬虫"""
 import sys
+import socket
+import asyncio
 from pathlib import Path
+from urllib.parse import urlsplit
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.crawlers.kr36_ai import Kr36AICrawler
 from src.utils.logger import logger
-import requests
+import aiohttp
+
+async def _probe_url(session, semaphore, url):
+    """探测单个URL，成功返回True"""
+    async with semaphore:
+        logger.info("测试: {}", url)
+        try:
+            async with session.get(url) as r:
+                text = await r.text()
+            logger.success("✅ 可访问! 状态码: {}, 长度: {}", r.status, len(text))
+            return True
+        except asyncio.TimeoutError:
+            logger.warning("❌ 超时: {}", url)
+        except Exception as e:
+            logger.error("❌ 错误: {} - {}: {}", url, type(e).__name__, str(e)[:50])
+    return False
+
+async def _resolve_hosts(hosts, timeout=2):
+    """并行预解析域名，返回解析成功的域名集合"""
+    loop = asyncio.get_running_loop()
+    
+    async def _resolve(host):
+        try:
+            # 超时后不再等待这次解析，卡住的域名直接判为失败
+            await asyncio.wait_for(loop.getaddrinfo(host, 443, type=socket.SOCK_STREAM), timeout)
+            return host
+        except Exception as e:
+            logger.warning("❌ DNS解析失败: {} - {}", host, type(e).__name__)
+            return None
+    
+    results = await asyncio.gather(*[_resolve(host) for host in hosts])
+    return {host for host in results if host}
+
+async def _probe_urls(test_urls, headers):
+    """并发探测所有URL"""
+    # DNS卡住的域名直接跳过，不占用连接/读取超时
+    resolved = await _resolve_hosts({urlsplit(url).hostname for url in test_urls})
+    
+    semaphore = asyncio.Semaphore(8)
+    # 连接和读取分别计时，TLS握手慢不会吃掉读取的时间
+    timeout = aiohttp.ClientTimeout(connect=2, sock_read=3)
+    connector = aiohttp.TCPConnector(limit=16)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+        return await asyncio.gather(
+            *[_probe_url(session, semaphore, url) for url in test_urls if urlsplit(url).hostname in resolved],
+            return_exceptions=True
+        )
 
 def test_url_access():
     """测试URL可访问性"""
@@ -18,18 +67,8 @@ def test_url_access():
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     
-    for url in test_urls:
-        logger.info(f"测试: {url}")
-        try:
-            r = requests.get(url, headers=headers, timeout=5)
-            logger.success(f"✅ 可访问! 状态码: {r.status_code}, 长度: {len(r.text)}")
-            return True
-        except requests.Timeout:
-            logger.warning(f"❌ 超时: {url}")
-        except Exception as e:
-            logger.error(f"❌ 错误: {url} - {type(e).__name__}: {str(e)[:50]}")
-    
-    return False
+    results = asyncio.run(_probe_urls(test_urls, headers))
+    return any(result is True for result in results)
 
 def test_crawl():
     """测试爬取功能"""
@@ -45,19 +84,19 @@ def test_crawl():
         articles = crawler.crawl_latest(max_articles=5)
         
         if articles:
-            logger.success(f"\n✅ 成功爬取 {len(articles)} 篇文章\n")
+            logger.success("\n✅ 成功爬取 {} 篇文章\n", len(articles))
             
             for i, article in enumerate(articles, 1):
-                logger.info(f"[{i}] {article.title}")
-                logger.info(f"    URL: {article.url}")
-                logger.info(f"    来源: {article.source}")
-                logger.info(f"    作者: {article.author or '未知'}")
-                logger.info(f"    时间: {article.publish_time or '未知'}")
-                logger.info(f"    内容长度: {len(article.content)} 字符")
-                logger.info(f"    标签: {', '.join(article.tags)}")
-                logger.info(f"    图片: {len(article.images)} 张")
+                logger.info("[{}] {}", i, article.title)
+                logger.info("    URL: {}", article.url)
+                logger.info("    来源: {}", article.source)
+                logger.info("    作者: {}", article.author or '未知')
+                logger.info("    时间: {}", article.publish_time or '未知')
+                logger.info("    内容长度: {} 字符", len(article.content))
+                logger.info("    标签: {}", ', '.join(article.tags))
+                logger.info("    图片: {} 张", len(article.images))
                 if article.content:
-                    logger.info(f"    内容预览: {article.content[:100]}...\n")
+                    logger.info("    内容预览: {}...\n", article.content[:100])
             
             # 保存文章
             crawler.save_articles(articles)
@@ -71,7 +110,7 @@ def test_crawl():
             logger.info("3. 网络连接问题")
             
     except Exception as e:
-        logger.error(f"❌ 爬取失败: {e}")
+        logger.error("❌ 爬取失败: {}", e)
         import traceback
         logger.error(traceback.format_exc())
 
@@ -1,7 +1,10 @@
 """测试其他AI资讯网站"""
-import requests
+import asyncio
 import time
 
+import aiohttp
+from bs4 import BeautifulSoup
+
 websites = [
     ("36氪AI", "https://www.36kr.com/search/articles/AI"),
     ("InfoQ AI", "https://www.infoq.cn/topic/ai"),
@@ -14,33 +17,59 @@ headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
-for name, url in websites:
-    print(f"\n{'='*60}")
-    print(f"测试: {name}")
-    print(f"URL: {url}")
-    print(f"{'='*60}")
-    
-    try:
+
+async def probe(session, semaphore, name, url):
+    """并发探测单个网站，返回结果字典"""
+    result = {'name': name, 'url': url}
+    async with semaphore:  # 限制并发数，避免请求过快
         start = time.time()
-        r = requests.get(url, headers=headers, timeout=5)
-        elapsed = time.time() - start
+        try:
+            async with session.get(url) as r:
+                text = await r.text()
+            result['status'] = r.status
+            result['elapsed'] = time.time() - start
+            result['text'] = text
+        except asyncio.TimeoutError:
+            result['error'] = "❌ 超时（5秒）"
+        except aiohttp.ClientConnectionError:
+            result['error'] = "❌ 连接错误"
+        except Exception as e:
+            result['error'] = f"❌ 错误: {type(e).__name__}: {str(e)[:100]}"
+    return result
+
+
+async def main():
+    semaphore = asyncio.Semaphore(8)
+    timeout = aiohttp.ClientTimeout(total=5)
+    connector = aiohttp.TCPConnector(limit=16)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+        results = await asyncio.gather(
+            *[probe(session, semaphore, name, url) for name, url in websites],
+            return_exceptions=True
+        )
+    
+    for (name, url), result in zip(websites, results):
+        print(f"\n{'='*60}")
+        print(f"测试: {name}")
+        print(f"URL: {url}")
+        print(f"{'='*60}")
+        
+        if isinstance(result, BaseException):
+            print(f"❌ 错误: {type(result).__name__}: {str(result)[:100]}")
+            continue
+        if 'error' in result:
+            print(result['error'])
+            continue
         
         print(f"✅ 成功!")
-        print(f"  状态码: {r.status_code}")
-        print(f"  耗时: {elapsed:.2f}秒")
-        print(f"  内容长度: {len(r.text)} 字符")
+        print(f"  状态码: {result['status']}")
+        print(f"  耗时: {result['elapsed']:.2f}秒")
+        print(f"  内容长度: {len(result['text'])} 字符")
         
         # 如果成功，显示标题
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(r.text, 'lxml')
+        soup = BeautifulSoup(result['text'], 'lxml')
         if soup.title:
             print(f"  标题: {soup.title.string}")
-        
-    except requests.Timeout:
-        print("❌ 超时（5秒）")
-    except requests.ConnectionError:
-        print("❌ 连接错误")
-    except Exception as e:
-        print(f"❌ 错误: {type(e).__name__}: {str(e)[:100]}")
-    
-    time.sleep(1)  # 避免请求过快
+
+
+asyncio.run(main())
@@ -52,7 +52,8 @@ def test_article_crawling():
         print(f"成功下载 {len(downloaded_images)} 张图片")
         
         # 保存结果
-        import json
+        import orjson
+        from pathlib import Path
         result_data = {
             'title': article_data.title,
             'author': article_data.author,
@@ -62,8 +63,9 @@ def test_article_crawling():
             'tags': article_data.tags
         }
         
-        with open('article_crawling_test_result.json', 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
+        Path('article_crawling_test_result.json').write_bytes(
+            orjson.dumps(result_data, option=orjson.OPT_INDENT_2)
+        )
         
         print("💾 测试结果已保存到 article_crawling_test_result.json")
         
@@ -1,14 +1,24 @@
-import requests
-import time
+import asyncio
+import aiohttp
+import orjson
 
-def test_background_music_feature():
+API_URL = 'http://localhost:8080/api/github/generate-video'
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+async def _generate_video(session, payload):
+    """提交视频生成请求，返回 (状态码, 结果)"""
+    async with session.post(API_URL, data=orjson.dumps(payload), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            return response.status, await response.json(loads=orjson.loads)
+        return response.status, None
+
+async def test_background_music_feature():
     """测试背景音乐功能"""
     
     print("🎵 测试背景音乐功能")
     print("=" * 50)
     
     # 测试1: 不包含音频的视频生成
-    print("\n1. 测试不包含背景音乐的视频生成...")
     payload_no_audio = {
         'github_url': 'https://github.com/remotion-dev/remotion',
         'include_screenshots': False,
@@ -16,29 +26,7 @@ def test_background_music_feature():
         'max_images': 2
     }
     
-    try:
-        response = requests.post(
-            'http://localhost:8080/api/github/generate-video',
-            json=payload_no_audio,
-            timeout=120
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ 无音频视频生成成功!")
-            print(f"   项目: {result['project_id']}")
-            print(f"   标题: {result['video_metadata']['title']}")
-        else:
-            print(f"❌ 无音频视频生成失败: {response.status_code}")
-            
-    except Exception as e:
-        print(f"❌ 无音频视频生成异常: {e}")
-    
-    # 等待一下避免请求过于频繁
-    time.sleep(2)
-    
     # 测试2: 包含音频的视频生成
-    print("\n2. 测试包含背景音乐的视频生成...")
     payload_with_audio = {
         'github_url': 'https://github.com/http-party/http-server',
         'include_screenshots': False,
@@ -46,26 +34,35 @@ def test_background_music_feature():
         'max_images': 2
     }
     
-    try:
-        response = requests.post(
-            'http://localhost:8080/api/github/generate-video',
-            json=payload_with_audio,
-            timeout=120
+    # 两个请求互不依赖，并发提交，结果按顺序输出
+    timeout = aiohttp.ClientTimeout(total=120)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        results = await asyncio.gather(
+            _generate_video(session, payload_no_audio),
+            _generate_video(session, payload_with_audio),
+            return_exceptions=True
         )
+    
+    cases = [
+        ("\n1. 测试不包含背景音乐的视频生成...", "无音频"),
+        ("\n2. 测试包含背景音乐的视频生成...", "有音频"),
+    ]
+    for (heading, label), outcome in zip(cases, results):
+        print(heading)
+        if isinstance(outcome, Exception):
+            print(f"❌ {label}视频生成异常: {outcome}")
+            continue
         
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ 有音频视频生成成功!")
+        status, result = outcome
+        if result is not None:
+            print(f"✅ {label}视频生成成功!")
             print(f"   项目: {result['project_id']}")
             print(f"   标题: {result['video_metadata']['title']}")
         else:
-            print(f"❌ 有音频视频生成失败: {response.status_code}")
-            
-    except Exception as e:
-        print(f"❌ 有音频视频生成异常: {e}")
+            print(f"❌ {label}视频生成失败: {status}")
     
     print("\n🎯 功能测试完成!")
     print("请在浏览器中访问 http://localhost:8080/static/github_video_maker.html 体验完整功能")
 
 if __name__ == "__main__":
-    test_background_music_feature()
\ No newline at end of file
+    asyncio.run(test_background_music_feature())
@@ -6,6 +6,16 @@ from services.github_content_service import ContentAnalyzer
 from src.models.github_models import GitHubProject
 from datetime import datetime
 
+KEY_TERMS = ('性能', 'TypeScript', 'Web框架', '开发者', '插件', '生态系统')
+COMPLETENESS_INDICATORS = ('解决', '功能', '特性', '优势', '价值')
+TECH_INDICATORS = ('TypeScript', '框架', '性能', '开发')
+
+_ALL_TERMS = frozenset(KEY_TERMS + COMPLETENESS_INDICATORS + TECH_INDICATORS)
+
+def find_terms(text):
+    """返回文本中出现的所有关键词"""
+    return {term for term in _ALL_TERMS if term in text}
+
 def test_enhanced_summary_generation():
     """测试增强的摘要生成功能（使用完整README）"""
     
@@ -105,21 +115,19 @@ MIT License - 查看[LICENSE](LICENSE)文件了解详情
     # 分析摘要质量
     print("🔍 摘要质量分析:")
     
-    # 检查是否包含关键信息
-    key_terms = ['性能', 'TypeScript', 'Web框架', '开发者', '插件', '生态系统']
-    found_terms = [term for term in key_terms if term in metadata.summary]
+    # 检查是否包含关键信息（先取出出现的所有关键词，再按类别取交集）
+    hits = find_terms(metadata.summary)
+    found_terms = [term for term in KEY_TERMS if term in hits]
     
     print(f"包含的关键术语: {', '.join(found_terms) if found_terms else '无'}")
     print(f"摘要长度: {len(metadata.summary)} 字符")
     
     # 检查摘要完整性
-    completeness_indicators = ['解决', '功能', '特性', '优势', '价值']
-    has_completeness = any(indicator in metadata.summary for indicator in completeness_indicators)
+    has_completeness = not hits.isdisjoint(COMPLETENESS_INDICATORS)
     print(f"包含完整性描述: {'✅' if has_completeness else '❌'}")
     
     # 检查技术信息
-    tech_indicators = ['TypeScript', '框架', '性能', '开发']
-    has_tech_info = any(indicator in metadata.summary for indicator in tech_indicators)
+    has_tech_info = not hits.isdisjoint(TECH_INDICATORS)
     print(f"包含技术信息: {'✅' if has_tech_info else '❌'}")
     
     print("\n🎯 测试完成!")
@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from services.github_screenshot_service import SyncGitHubScreenshotService, ScreenshotOptions
 
@@ -9,9 +10,6 @@ def test_improved_fallback():
     print("🔧 测试改进的Playwright降级机制")
     print("=" * 50)
     
-    # 创建测试服务
-    service = SyncGitHubScreenshotService(headless=True)
-    
     # 测试数据
     test_cases = [
         {
@@ -31,29 +29,34 @@ def test_improved_fallback():
     
     success_count = 0
     
-    for i, test_case in enumerate(test_cases, 1):
+    options = ScreenshotOptions(width=1200, height=800, quality=85)
+    
+    def run_case(test_case):
+        try:
+            # 执行截图
+            return service.take_screenshot_sync(test_case['url'], test_case['path'], options), None
+        except Exception as e:
+            return None, e
+    
+    # 所有案例共用一个浏览器实例，并发截图，结果按顺序输出
+    with SyncGitHubScreenshotService(headless=True) as service:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(run_case, test_cases))
+    
+    for i, (test_case, (result, error)) in enumerate(zip(test_cases, results), 1):
         print(f"\n测试案例 {i}: {test_case['name']}")
         print("-" * 30)
         print(f"URL: {test_case['url']}")
         print(f"保存路径: {test_case['path']}")
         
-        try:
-            # 执行截图
-            result = service.take_screenshot_sync(
-                test_case['url'],
-                test_case['path'],
-                ScreenshotOptions(width=1200, height=800, quality=85)
-            )
-            
-            if result and test_case['path'].exists():
-                file_size = test_case['path'].stat().st_size
-                print(f"✅ 截图成功! 文件大小: {file_size} bytes")
-                success_count += 1
-            else:
-                print("❌ 截图失败")
-                
-        except Exception as e:
-            print(f"❌ 测试异常: {e}")
+        if error is not None:
+            print(f"❌ 测试异常: {error}")
+        elif result and test_case['path'].exists():
+            file_size = test_case['path'].stat().st_size
+            print(f"✅ 截图成功! 文件大小: {file_size} bytes")
+            success_count += 1
+        else:
+            print("❌ 截图失败")
     
     print(f"\n🎯 测试总结: {success_count}/{len(test_cases)} 成功")
     
@@ -42,19 +42,21 @@ async def test_gif_collection():
             print(f"📝 内容长度: {len(result['content'])} 字符")
             print(f"📊 总图片数量: {len(result['images'])} 张")
             
-            # 3. 统计图片格式
+            # 3. 统计图片格式（每个URL只转一次小写，顺便收集GIF图片）
             gif_count = 0
             jpg_count = 0
             png_count = 0
             other_count = 0
+            gif_images = []
             
             for img in result['images']:
-                img_url = img.get('url', '')
-                if '.gif' in img_url.lower() or 'data:image/gif' in img_url.lower():
+                img_url = img.get('url', '').lower()
+                if '.gif' in img_url or 'data:image/gif' in img_url:
                     gif_count += 1
-                elif '.jpg' in img_url.lower() or '.jpeg' in img_url.lower():
+                    gif_images.append(img)
+                elif '.jpg' in img_url or '.jpeg' in img_url:
                     jpg_count += 1
-                elif '.png' in img_url.lower():
+                elif '.png' in img_url:
                     png_count += 1
                 else:
                     other_count += 1
@@ -70,8 +72,7 @@ async def test_gif_collection():
                 print(f"\n🎯 发现 {gif_count} 张GIF图片，正在进行下载测试...")
                 
                 # 只测试前3张GIF图片
-                gif_images = [img for img in result['images'] 
-                            if '.gif' in img.get('url', '').lower() or 'data:image/gif' in img.get('url', '').lower()][:3]
+                gif_images = gif_images[:3]
                 
                 for i, img in enumerate(gif_images):
                     print(f"\n--- 测试 GIF {i+1} ---")
@@ -12,7 +12,32 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from services.crawler_service import CrawlerService
+import os
 import base64
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+# Content-Type子类型到扩展名的映射
+CONTENT_TYPE_EXTS = {'gif': '.gif', 'png': '.png', 'jpeg': '.jpg', 'jpg': '.jpg'}
+# 传入 --deep-verify 时额外用PIL完整校验图片
+DEEP_VERIFY = '--deep-verify' in sys.argv
+# 图片文件头魔数
+_SNIFF = {b'\xff\xd8\xff': 'jpg', b'GIF8': 'gif', b'\x89PNG': 'png'}
+
+def sniff_image_format(path):
+    """读取文件头16字节判断图片格式，无法识别时返回None"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.read(fd, 16)
+    finally:
+        os.close(fd)
+    for magic, fmt in _SNIFF.items():
+        if head.startswith(magic):
+            return fmt
+    return None
 
 def test_gif_functions():
     """测试GIF相关功能"""
@@ -51,29 +76,34 @@ def test_gif_functions():
         "https://httpbin.org/image/svg",   # SVG图片
     ]
     
-    for url in test_urls:
+    # 共享连接池，三个HEAD请求并发发出
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=1))
+    head = functools.partial(session.head, timeout=10)
+    
+    def probe(url):
         try:
-            import requests
-            response = requests.head(url, timeout=10)
-            content_type = response.headers.get('content-type', 'unknown')
-            print(f"URL: {url}")
-            print(f"Content-Type: {content_type}")
-            
-            # 模拟我们的扩展名检测逻辑
-            if 'gif' in content_type:
-                ext = '.gif'
-            elif 'png' in content_type:
-                ext = '.png'
-            elif 'jpeg' in content_type or 'jpg' in content_type:
-                ext = '.jpg'
-            else:
-                ext = '.unknown'
-            
-            print(f"检测到的扩展名: {ext}")
-            print()
-            
+            return head(url), None
         except Exception as e:
-            print(f"测试 {url} 失败: {e}")
+            return None, e
+    
+    with session, ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(probe, test_urls))
+    
+    for url, (response, error) in zip(test_urls, results):
+        if error is not None:
+            print(f"测试 {url} 失败: {error}")
+            continue
+        
+        content_type = response.headers.get('content-type', 'unknown')
+        print(f"URL: {url}")
+        print(f"Content-Type: {content_type}")
+        
+        # 模拟我们的扩展名检测逻辑
+        ext = CONTENT_TYPE_EXTS.get(content_type.split(';')[0].split('/')[-1].strip(), '.unknown')
+        
+        print(f"检测到的扩展名: {ext}")
+        print()
     
     # 3. 测试文件格式验证
     print("3. 测试图片文件验证")
@@ -91,13 +121,21 @@ def test_gif_functions():
         
         # 保存到文件
         test_file = test_dir / "test_image.jpg"
-        with open(test_file, 'wb') as f:
-            f.write(test_buffer.getvalue())
+        # getbuffer()直接暴露BytesIO内部内存，不额外复制一份bytes
+        with test_buffer.getbuffer() as image_view:
+            expected_digest = hashlib.sha256(image_view).hexdigest()
+            with open(test_file, 'wb') as f:
+                f.write(image_view)
         
-        # 验证图片
+        # 验证图片：比对内容哈希并检查文件头，识别不了或要求深度校验时再交给PIL
         try:
-            with Image.open(test_file) as img:
-                img.verify()
+            with open(test_file, 'rb') as f:
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            if digest != expected_digest:
+                raise ValueError("文件内容与写入数据不一致")
+            if DEEP_VERIFY or sniff_image_format(test_file) is None:
+                with Image.open(test_file) as img:
+                    img.verify()
             print(f"✅ 图片验证成功: {test_file}")
         except Exception as e:
             print(f"❌ 图片验证失败: {e}")
@@ -4,7 +4,9 @@
 测试GIF处理器功能
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -18,6 +20,39 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _process_one(gif_path, output_dir):
+    """在子进程中完成单个GIF的完整处理流程，返回结果由主进程打印"""
+    result = {'name': gif_path.name, 'props': None, 'analysis': None, 'frames': None, 'conversion': None}
+    
+    # 1. 格式检测
+    result['is_gif'] = gif_processor.is_gif_file(str(gif_path))
+    
+    # 2. 属性提取
+    result['props'] = gif_processor.get_gif_properties(str(gif_path))
+    if not result['props']:
+        return result
+    
+    # 3. 兼容性分析
+    result['analysis'] = gif_processor.analyze_gif_compatibility(str(gif_path))
+    
+    # 4. 帧提取（只返回帧数和尺寸，避免跨进程传输帧数据）
+    frames = gif_processor.extract_gif_frames(str(gif_path))
+    if not frames:
+        return result
+    result['frames'] = (len(frames), frames[0].shape)
+    
+    # 5. 视频转换（每个进程单线程编码，并行度由进程池控制）
+    output_path = output_dir / f"{gif_path.stem}_converted.mp4"
+    success = gif_processor.convert_gif_to_video(
+        gif_path=str(gif_path),
+        output_path=str(output_path),
+        target_duration=3.0,  # 3秒视频
+        threads=1
+    )
+    file_size = output_path.stat().st_size / 1024 if success and output_path.exists() else None  # KB
+    result['conversion'] = (output_path, file_size)
+    return result
+
 def test_gif_processor():
     """测试GIF处理器的各项功能"""
     print("🧪 测试GIF处理器功能")
@@ -37,61 +72,57 @@ def test_gif_processor():
     
     print(f"🔍 找到 {len(test_gifs)} 个测试GIF文件")
     
-    for gif_path in test_gifs:
-        print(f"\n--- 测试文件: {gif_path.name} ---")
+    # 每个GIF在独立进程中处理，结果按输入顺序打印
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_process_one, test_gifs, [output_dir] * len(test_gifs))
         
-        # 1. 格式检测测试
-        print("1. 格式检测测试:")
-        is_gif = gif_processor.is_gif_file(str(gif_path))
-        print(f"   是否为GIF文件: {is_gif}")
-        
-        # 2. 属性提取测试
-        print("2. 属性提取测试:")
-        props = gif_processor.get_gif_properties(str(gif_path))
-        if props:
-            print(f"   帧数: {props.get('frame_count', '未知')}")
-            print(f"   持续时间: {props.get('duration', '未知')} ms")
-            print(f"   循环次数: {props.get('loop_count', '未知')}")
-            print(f"   尺寸: {props.get('size', '未知')}")
-        else:
-            print("   ❌ 无法提取属性")
-            continue
-        
-        # 3. 兼容性分析测试
-        print("3. 兼容性分析测试:")
-        analysis = gif_processor.analyze_gif_compatibility(str(gif_path))
-        print(f"   是否有效: {analysis['is_valid']}")
-        if analysis['issues']:
-            print(f"   问题: {', '.join(analysis['issues'])}")
-        if analysis['recommendations']:
-            print(f"   建议: {', '.join(analysis['recommendations'])}")
-        
-        # 4. 帧提取测试
-        print("4. 帧提取测试:")
-        frames = gif_processor.extract_gif_frames(str(gif_path))
-        if frames:
-            print(f"   ✅ 成功提取 {len(frames)} 帧")
-            print(f"   帧尺寸: {frames[0].shape if frames else '未知'}")
-        else:
-            print("   ❌ 帧提取失败")
-            continue
-        
-        # 5. 视频转换测试
-        print("5. 视频转换测试:")
-        output_path = output_dir / f"{gif_path.stem}_converted.mp4"
-        success = gif_processor.convert_gif_to_video(
-            gif_path=str(gif_path),
-            output_path=str(output_path),
-            target_duration=3.0  # 3秒视频
-        )
-        
-        if success and output_path.exists():
-            file_size = output_path.stat().st_size / 1024  # KB
-            print(f"   ✅ 转换成功")
-            print(f"   输出文件: {output_path}")
-            print(f"   文件大小: {file_size:.1f} KB")
-        else:
-            print("   ❌ 转换失败")
+        for result in results:
+            print(f"\n--- 测试文件: {result['name']} ---")
+            
+            # 1. 格式检测测试
+            print("1. 格式检测测试:")
+            print(f"   是否为GIF文件: {result['is_gif']}")
+            
+            # 2. 属性提取测试
+            print("2. 属性提取测试:")
+            props = result['props']
+            if props:
+                print(f"   帧数: {props.get('frame_count', '未知')}")
+                print(f"   持续时间: {props.get('duration', '未知')} ms")
+                print(f"   循环次数: {props.get('loop_count', '未知')}")
+                print(f"   尺寸: {props.get('size', '未知')}")
+            else:
+                print("   ❌ 无法提取属性")
+                continue
+            
+            # 3. 兼容性分析测试
+            print("3. 兼容性分析测试:")
+            analysis = result['analysis']
+            print(f"   是否有效: {analysis['is_valid']}")
+            if analysis['issues']:
+                print(f"   问题: {', '.join(analysis['issues'])}")
+            if analysis['recommendations']:
+                print(f"   建议: {', '.join(analysis['recommendations'])}")
+            
+            # 4. 帧提取测试
+            print("4. 帧提取测试:")
+            if result['frames']:
+                frame_count, frame_shape = result['frames']
+                print(f"   ✅ 成功提取 {frame_count} 帧")
+                print(f"   帧尺寸: {frame_shape}")
+            else:
+                print("   ❌ 帧提取失败")
+                continue
+            
+            # 5. 视频转换测试
+            print("5. 视频转换测试:")
+            output_path, file_size = result['conversion']
+            if file_size is not None:
+                print(f"   ✅ 转换成功")
+                print(f"   输出文件: {output_path}")
+                print(f"   文件大小: {file_size:.1f} KB")
+            else:
+                print("   ❌ 转换失败")
     
     # 6. 测试便捷函数
     print(f"\n--- 测试便捷函数 ---")
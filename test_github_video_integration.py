@@ -1,5 +1,8 @@
-import requests
+from test_utils import get_session
 import os
+import shutil
+
+_SESSION = get_session()
 
 def test_github_video_integration():
     print("🚀 GitHub视频生成功能完整测试")
@@ -13,7 +16,7 @@ def test_github_video_integration():
         'max_images': 3
     }
     
-    response = requests.post(
+    response = _SESSION.post(
         'http://localhost:8080/api/github/generate-video',
         json=payload,
         timeout=120
@@ -33,27 +36,30 @@ def test_github_video_integration():
     
     # 2. 获取项目列表
     print("\n2. 获取项目信息...")
-    projects_response = requests.get('http://localhost:8080/api/github/projects')
+    projects_response = _SESSION.get('http://localhost:8080/api/github/projects')
     projects = projects_response.json()
     latest_project = projects[0]
     print(f"   最新项目: {latest_project['name']} ({latest_project['id']})")
     
     # 3. 测试获取视频文件
     print("\n3. 获取生成的视频文件...")
-    video_response = requests.get(f"http://localhost:8080/api/github/projects/{latest_project['id']}/video")
+    video_url = f"http://localhost:8080/api/github/projects/{latest_project['id']}/video"
     
-    if video_response.status_code == 200:
-        # 保存视频文件
-        video_filename = f"generated_video_{latest_project['id']}.mp4"
-        with open(video_filename, 'wb') as f:
-            f.write(video_response.content)
-        
-        file_size = os.path.getsize(video_filename)
-        print(f"✅ 视频文件获取成功!")
-        print(f"   文件名: {video_filename}")
-        print(f"   大小: {file_size} bytes ({file_size/1024/1024:.2f} MB)")
-    else:
-        print("❌ 获取视频文件失败:", video_response.text)
+    # 流式下载，视频不整体驻留内存
+    with _SESSION.get(video_url, stream=True, timeout=120) as video_response:
+        if video_response.status_code == 200:
+            # 保存视频文件
+            video_filename = f"generated_video_{latest_project['id']}.mp4"
+            video_response.raw.decode_content = True
+            with open(video_filename, 'wb') as f:
+                shutil.copyfileobj(video_response.raw, f, length=64 * 1024)
+                file_size = os.fstat(f.fileno()).st_size
+            
+            print(f"✅ 视频文件获取成功!")
+            print(f"   文件名: {video_filename}")
+            print(f"   大小: {file_size} bytes ({file_size/1024/1024:.2f} MB)")
+        else:
+            print("❌ 获取视频文件失败:", video_response.text)
 
 if __name__ == "__main__":
     test_github_video_integration()
\ No newline at end of file
@@ -1,6 +1,21 @@
 import sys
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from services.selenium_screenshot_service import SyncSeleniumScreenshotService
+from test_utils import file_size_kb
+from services.selenium_screenshot_service import SeleniumScreenshotService
+
+MAX_WORKERS = 3
+
+def _start_driver():
+    """启动一个浏览器实例，失败返回None"""
+    service = SeleniumScreenshotService(headless=True)
+    try:
+        service.start()
+        return service
+    except Exception as e:
+        print(f"⚠️  浏览器启动失败: {e}")
+        return None
 
 def test_multiple_highlight_scenarios():
     """测试多种场景下的高亮效果"""
@@ -30,37 +45,58 @@ def test_multiple_highlight_scenarios():
     # 确保输出目录存在
     Path('test_outputs').mkdir(exist_ok=True)
     
-    selenium_service = SyncSeleniumScreenshotService(headless=True)
-    
-    success_count = 0
+    # WebDriver不是线程安全的：预先启动一组浏览器，每个任务从池中借用一个
+    driver_pool = queue.Queue()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for service in executor.map(lambda _: _start_driver(), range(min(MAX_WORKERS, len(test_cases)))):
+            if service:
+                driver_pool.put(service)
+    started = list(driver_pool.queue)
     
-    for i, case in enumerate(test_cases, 1):
-        print(f"\n测试案例 {i}: {case['name']}")
-        print(f"描述: {case['description']}")
-        print(f"URL: {case['url']}")
-        print("-" * 40)
+    def run_case(indexed_case):
+        i, case = indexed_case
+        output_path = Path(f"test_outputs/highlight_{i}_{case['name'].replace(' ', '_')}.jpg")
+        if not started:
+            return output_path, False, RuntimeError("没有可用的浏览器")
         
+        service = driver_pool.get()
         try:
-            output_path = Path(f"test_outputs/highlight_{i}_{case['name'].replace(' ', '_')}.jpg")
-            
-            result = selenium_service.take_screenshot_sync(
+            result = service.take_screenshot(
                 case['url'],
                 output_path,
                 width=1920,
                 height=1080,
                 wait_time=5
             )
-            
-            if result and output_path.exists():
-                size_kb = output_path.stat().st_size / 1024
-                print(f"✅ 截图成功! 文件大小: {size_kb:.1f} KB")
-                print(f"   保存路径: {output_path}")
-                success_count += 1
-            else:
-                print("❌ 截图失败")
-                
+            return output_path, result, None
         except Exception as e:
-            print(f"❌ 测试异常: {e}")
+            return output_path, False, e
+        finally:
+            driver_pool.put(service)
+    
+    # 各案例并行截图，结果按顺序输出
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(run_case, enumerate(test_cases, 1)))
+    finally:
+        for service in started:
+            service.stop()
+    
+    success_count = 0
+    for i, (case, (output_path, result, error)) in enumerate(zip(test_cases, results), 1):
+        print(f"\n测试案例 {i}: {case['name']}")
+        print(f"描述: {case['description']}")
+        print(f"URL: {case['url']}")
+        print("-" * 40)
+        
+        if error is not None:
+            print(f"❌ 测试异常: {error}")
+        elif result and (size_kb := file_size_kb(output_path)) is not None:
+            print(f"✅ 截图成功! 文件大小: {size_kb:.1f} KB")
+            print(f"   保存路径: {output_path}")
+            success_count += 1
+        else:
+            print("❌ 截图失败")
     
     print(f"\n🎯 多场景测试总结: {success_count}/{len(test_cases)} 成功")
     
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from test_utils import file_size_kb
 from services.github_screenshot_service import SyncGitHubScreenshotService, ScreenshotOptions
 from services.selenium_screenshot_service import SyncSeleniumScreenshotService
 
@@ -28,8 +29,7 @@ def test_highlighted_screenshot():
             wait_time=5  # 增加等待时间确保元素加载
         )
         
-        if result and selenium_path.exists():
-            size_kb = selenium_path.stat().st_size / 1024
+        if result and (size_kb := file_size_kb(selenium_path)) is not None:
             print(f"✅ Selenium高亮截图成功! 文件大小: {size_kb:.1f} KB")
             print(f"   保存路径: {selenium_path}")
         else:
@@ -62,8 +62,7 @@ def test_highlighted_screenshot():
                 options
             )
             
-            if result and playwright_path.exists():
-                size_kb = playwright_path.stat().st_size / 1024
+            if result and (size_kb := file_size_kb(playwright_path)) is not None:
                 print(f"✅ Playwright高亮截图成功! 文件大小: {size_kb:.1f} KB")
                 print(f"   保存路径: {playwright_path}")
             else:
@@ -88,13 +87,13 @@ def compare_highlight_results():
     # 但由于高亮只是视觉效果，文件大小差异可能不大
     
     selenium_path = Path('test_outputs/highlighted_selenium.jpg')
-    if selenium_path.exists():
-        size = selenium_path.stat().st_size / 1024
+    size = file_size_kb(selenium_path)
+    if size is not None:
         print(f"Selenium高亮截图: {size:.1f} KB")
     
     playwright_path = Path('test_outputs/highlighted_playwright.jpg')
-    if playwright_path.exists():
-        size = playwright_path.stat().st_size / 1024
+    size = file_size_kb(playwright_path)
+    if size is not None:
         print(f"Playwright高亮截图: {size:.1f} KB")
 
 if __name__ == "__main__":
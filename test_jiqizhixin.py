@@ -5,7 +5,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.crawlers.jiqizhixin import JiqizhixinCrawler
 from src.utils.logger import logger
-import requests
+from test_utils import get_probe_session
+
+# 连通性探测走不重试的会话，不可达的地址按超时立即失败
+_SESSION = get_probe_session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
 
 def test_connection_first():
     """先测试网站连接"""
@@ -14,18 +20,17 @@ def test_connection_first():
         ("机器之心(无www)", "https://jiqizhixin.com"),
     ]
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     for name, url in test_urls:
         try:
-            logger.info(f"测试 {name}: {url}")
-            r = requests.get(url, headers=headers, timeout=5)
-            logger.success(f"✅ {name} 可访问！状态码: {r.status_code}")
+            logger.info("测试 {}: {}", name, url)
+            # 只探测可达性，用HEAD不下载页面；服务器不支持HEAD时再GET
+            r = _SESSION.head(url, timeout=2, allow_redirects=True)
+            if r.status_code == 405:
+                r = _SESSION.get(url, timeout=2)
+            logger.success("✅ {} 可访问！状态码: {}", name, r.status_code)
             return True
         except Exception as e:
-            logger.warning(f"❌ {name} 不可访问: {e}")
+            logger.warning("❌ {} 不可访问: {}", name, e)
     
     logger.error("所有URL都无法访问，请检查网络或使用代理")
     return False
@@ -45,13 +50,13 @@ def test_single_article():
     
     if article:
         logger.success("爬取成功！")
-        logger.info(f"\n标题: {article.title}")
-        logger.info(f"作者: {article.author}")
-        logger.info(f"发布时间: {article.publish_time}")
-        logger.info(f"标签: {', '.join(article.tags)}")
-        logger.info(f"图片数量: {len(article.images)}")
-        logger.info(f"正文长度: {len(article.content)} 字符")
-        logger.info(f"\n正文预览:\n{article.content[:200]}...")
+        logger.info("\n标题: {}", article.title)
+        logger.info("作者: {}", article.author)
+        logger.info("发布时间: {}", article.publish_time)
+        logger.info("标签: {}", ', '.join(article.tags))
+        logger.info("图片数量: {}", len(article.images))
+        logger.info("正文长度: {} 字符", len(article.content))
+        logger.info("\n正文预览:\n{}...", article.content[:200])
         
         # 保存到文件
         crawler.save_articles([article])
@@ -68,12 +73,12 @@ def test_list_page():
     
     articles = crawler.crawl_latest(max_articles=5)
     
-    logger.success(f"\n总共爬取了 {len(articles)} 篇文章")
+    logger.success("\n总共爬取了 {} 篇文章", len(articles))
     
     for i, article in enumerate(articles, 1):
-        logger.info(f"\n[{i}] {article.title}")
-        logger.info(f"    URL: {article.url}")
-        logger.info(f"    时间: {article.publish_time}")
+        logger.info("\n[{}] {}", i, article.title)
+        logger.info("    URL: {}", article.url)
+        logger.info("    时间: {}", article.publish_time)
     
     if articles:
         crawler.save_articles(articles)
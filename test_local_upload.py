@@ -2,27 +2,46 @@
 测试本地图片上传功能
 """
 
+import functools
+import io
 import requests
+from test_utils import get_session
 import os
 from pathlib import Path
 
+_SESSION = get_session()
+
+@functools.lru_cache(maxsize=1)
+def _test_image_bytes() -> bytes:
+    """生成测试用JPEG图片（只编码一次，之后直接复用内存中的字节）"""
+    from PIL import Image, ImageDraw
+    # 创建一个红色的测试图片
+    img = Image.new('RGB', (200, 200), color='red')
+    draw = ImageDraw.Draw(img)
+    draw.text((50, 90), "Test Image", fill='white')
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG')
+    return buf.getvalue()
+
+# 前端页面应包含的关键元素: (检查项, 页面标记)
+FRONTEND_MARKERS = [
+    ('上传本地图片按钮', '上传本地图片'),
+    ('文件输入控件', 'localImageInput'),
+    ('上传状态显示', 'uploadStatus'),
+    ('本地上传标记', 'local-upload-badge'),
+    ('上传处理函数', 'handleLocalImageUpload'),
+]
+
 def test_local_image_upload():
     """测试本地图片上传功能"""
     print("🔍 测试本地图片上传功能")
     print("=" * 40)
     
-    # 准备测试图片
-    test_image_path = "test_upload_image.jpg"
-    
-    # 创建一个简单的测试图片
+    # 准备测试图片（内存中编码，不落盘）
+    test_image_name = "test_upload_image.jpg"
     try:
-        from PIL import Image, ImageDraw
-        # 创建一个红色的测试图片
-        img = Image.new('RGB', (200, 200), color='red')
-        draw = ImageDraw.Draw(img)
-        draw.text((50, 90), "Test Image", fill='white')
-        img.save(test_image_path)
-        print(f"✅ 创建测试图片: {test_image_path}")
+        image_bytes = _test_image_bytes()
+        print(f"✅ 创建测试图片: {test_image_name} ({len(image_bytes)} bytes)")
     except ImportError:
         print("❌ PIL库未安装，跳过图片创建")
         return False
@@ -34,9 +53,8 @@ def test_local_image_upload():
     try:
         url = "http://localhost:8080/api/upload-local-image"
         
-        with open(test_image_path, 'rb') as f:
-            files = {'image': (test_image_path, f, 'image/jpeg')}
-            response = requests.post(url, files=files)
+        files = {'image': (test_image_name, image_bytes, 'image/jpeg')}
+        response = _SESSION.post(url, files=files)
         
         if response.status_code == 200:
             result = response.json()
@@ -68,11 +86,6 @@ def test_local_image_upload():
     except Exception as e:
         print(f"❌ 测试过程中发生错误: {e}")
         return False
-    finally:
-        # 清理测试文件
-        if os.path.exists(test_image_path):
-            os.remove(test_image_path)
-            print(f"🧹 已删除测试文件: {test_image_path}")
 
 def test_frontend_integration():
     """测试前端集成"""
@@ -80,17 +93,11 @@ def test_frontend_integration():
     print("=" * 40)
     
     try:
-        response = requests.get("http://localhost:8080/")
+        response = _SESSION.get("http://localhost:8080/")
         if response.status_code == 200:
             content = response.text
             # 检查关键元素是否存在
-            checks = [
-                ('上传本地图片按钮', '上传本地图片' in content),
-                ('文件输入控件', 'localImageInput' in content),
-                ('上传状态显示', 'uploadStatus' in content),
-                ('本地上传标记', 'local-upload-badge' in content),
-                ('上传处理函数', 'handleLocalImageUpload' in content)
-            ]
+            checks = [(check_name, marker in content) for check_name, marker in FRONTEND_MARKERS]
             
             all_passed = True
             for check_name, passed in checks:
@@ -1,7 +1,29 @@
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from test_utils import file_size_kb
 from services.github_screenshot_service import SyncGitHubScreenshotService, ScreenshotOptions
 
+def _shoot(test_case):
+    """在独立进程中执行单个截图案例，返回 (名称, 是否成功, 文件大小KB, 异常信息)"""
+    try:
+        # 每个进程各自创建服务和浏览器，互不共享驱动状态
+        service = SyncGitHubScreenshotService(headless=True)
+        # 执行截图（会自动选择最佳方案）
+        options = ScreenshotOptions(width=1920, height=1080, quality=90)
+        result = service.take_screenshot_sync(
+            test_case['url'],
+            test_case['path'],
+            options
+        )
+        
+        size_kb = file_size_kb(test_case['path']) if result else None
+        if size_kb is not None:
+            return test_case['name'], True, size_kb, None
+        return test_case['name'], False, 0.0, None
+    except Exception as e:
+        return test_case['name'], False, 0.0, str(e)
+
 def test_multi_layer_fallback():
     """测试多层次降级机制"""
     
@@ -13,9 +35,6 @@ def test_multi_layer_fallback():
     print(f"Python版本: {python_version.major}.{python_version.minor}.{python_version.micro}")
     print(f"操作系统: {sys.platform}")
     
-    # 创建测试服务
-    service = SyncGitHubScreenshotService(headless=True)
-    
     # 测试用例
     test_cases = [
         {
@@ -35,39 +54,31 @@ def test_multi_layer_fallback():
     
     success_count = 0
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n测试案例 {i}: {test_case['name']}")
+    # 每个案例在独立进程中运行，浏览器启动和网络等待相互重叠
+    with ProcessPoolExecutor(max_workers=len(test_cases)) as executor:
+        results = list(executor.map(_shoot, test_cases))
+    
+    for i, (test_case, (name, success, size_kb, error)) in enumerate(zip(test_cases, results), 1):
+        print(f"\n测试案例 {i}: {name}")
         print("-" * 40)
         print(f"URL: {test_case['url']}")
         
-        try:
-            # 执行截图（会自动选择最佳方案）
-            options = ScreenshotOptions(width=1920, height=1080, quality=90)
-            result = service.take_screenshot_sync(
-                test_case['url'],
-                test_case['path'],
-                options
-            )
+        if error:
+            print(f"❌ 测试异常: {error}")
+        elif success:
+            print(f"✅ 截图成功! 文件大小: {size_kb:.1f} KB")
             
-            if result and test_case['path'].exists():
-                file_size = test_case['path'].stat().st_size
-                size_kb = file_size / 1024
-                print(f"✅ 截图成功! 文件大小: {size_kb:.1f} KB")
-                
-                # 根据文件大小判断使用的方案
-                if size_kb > 100:
-                    print("   🎯 使用了Selenium高质量截图")
-                elif size_kb > 50:
-                    print("   🔄 使用了改进的降级截图")
-                else:
-                    print("   ⚠️  使用了基础降级截图")
-                    
-                success_count += 1
+            # 根据文件大小判断使用的方案
+            if size_kb > 100:
+                print("   🎯 使用了Selenium高质量截图")
+            elif size_kb > 50:
+                print("   🔄 使用了改进的降级截图")
             else:
-                print("❌ 截图失败")
+                print("   ⚠️  使用了基础降级截图")
                 
-        except Exception as e:
-            print(f"❌ 测试异常: {e}")
+            success_count += 1
+        else:
+            print("❌ 截图失败")
     
     print(f"\n🎯 测试总结: {success_count}/{len(test_cases)} 成功")
     
@@ -98,8 +109,7 @@ def compare_solutions():
         selenium_path = Path("test_outputs/compare_selenium.jpg")
         
         result = selenium_service.take_screenshot_sync(test_url, selenium_path)
-        if result and selenium_path.exists():
-            size = selenium_path.stat().st_size / 1024
+        if result and (size := file_size_kb(selenium_path)) is not None:
             results['Selenium'] = f"{size:.1f} KB"
             print(f"Selenium: ✅ {size:.1f} KB")
         else:
@@ -115,8 +125,7 @@ def compare_solutions():
         fallback_path = Path("test_outputs/compare_fallback.jpg")
         
         result = service._fallback_screenshot(test_url, fallback_path)
-        if result and fallback_path.exists():
-            size = fallback_path.stat().st_size / 1024
+        if result and (size := file_size_kb(fallback_path)) is not None:
             results['降级方案'] = f"{size:.1f} KB"
             print(f"降级方案: ✅ {size:.1f} KB")
         else:
@@ -13,6 +13,26 @@ sys.path.insert(0, str(project_root))
 
 from services.crawler_service import CrawlerService
 import asyncio
+import hashlib
+import time
+import orjson
+
+# 页面内容本地缓存，避免每次运行都访问外部网站；传入 --no-cache 强制重新抓取
+PAGE_CACHE_DIR = Path("data/cache/page_fixtures")
+PAGE_CACHE_TTL = 24 * 3600
+USE_PAGE_CACHE = '--no-cache' not in sys.argv
+
+async def get_page_content_cached(url):
+    """带磁盘缓存的 CrawlerService.get_page_content"""
+    cache_file = PAGE_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    if USE_PAGE_CACHE and cache_file.exists() and time.time() - cache_file.stat().st_mtime < PAGE_CACHE_TTL:
+        cached = orjson.loads(cache_file.read_bytes())
+        return cached['html'], cached['title']
+    
+    html, title = await CrawlerService.get_page_content(url)
+    PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(orjson.dumps({'url': url, 'html': html, 'title': title}))
+    return html, title
 
 async def test_pgc_img_extraction():
     """测试pgc-img图片提取"""
@@ -25,7 +45,7 @@ async def test_pgc_img_extraction():
     try:
         # 1. 获取页面内容
         print("📥 正在获取页面内容...")
-        html, title = await CrawlerService.get_page_content(test_url)
+        html, title = await get_page_content_cached(test_url)
         print(f"📄 页面标题: {title}")
         
         # 2. 提取内容和图片
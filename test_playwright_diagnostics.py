@@ -1,6 +1,5 @@
 import asyncio
 import sys
-from playwright.async_api import async_playwright
 from loguru import logger
 
 async def test_playwright_basic():
@@ -10,6 +9,7 @@ async def test_playwright_basic():
     
     try:
         print("1. 启动Playwright...")
+        from playwright.async_api import async_playwright
         playwright = await async_playwright().start()
         print("✅ Playwright启动成功")
         
@@ -24,27 +24,25 @@ async def test_playwright_basic():
         )
         print("✅ 浏览器启动成功")
         
-        print("3. 创建新页面...")
-        page = await browser.new_page()
+        print("3. 创建新页面（1920x1080视口）...")
+        # 视口在创建页面时一并指定，省去单独设置视口的一次往返
+        page = await browser.new_page(viewport={"width": 1920, "height": 1080})
         print("✅ 页面创建成功")
         
-        print("4. 设置视口...")
-        await page.set_viewport_size({"width": 1920, "height": 1080})
-        print("✅ 视口设置成功")
-        
-        print("5. 访问测试页面...")
-        await page.goto("https://httpbin.org/html", wait_until="networkidle", timeout=10000)
+        print("4. 访问测试页面...")
+        await page.goto("https://httpbin.org/html", wait_until="domcontentloaded", timeout=10000)
         print("✅ 页面访问成功")
         
-        print("6. 等待页面加载...")
-        await page.wait_for_timeout(2000)
+        print("5. 等待页面加载...")
+        await page.wait_for_selector("h1", timeout=5000)
         print("✅ 页面加载完成")
         
-        print("7. 截图...")
-        await page.screenshot(path="test_screenshot.jpg", full_page=True, quality=80)
+        print("6. 截图...")
+        # 只截取视口，诊断截图功能无需滚动拼接整页
+        await page.screenshot(path="test_screenshot.jpg", full_page=False, type="jpeg", quality=80)
         print("✅ 截图成功")
         
-        print("8. 关闭资源...")
+        print("7. 关闭资源...")
         await page.close()
         await browser.close()
         await playwright.stop()
@@ -64,19 +62,14 @@ def test_sync_wrapper():
     print("=" * 30)
     
     try:
-        import asyncio
+        # 与同步截图服务一致：Windows下使用Selector事件循环策略
         if sys.platform == 'win32':
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(test_playwright_basic())
-            print(f"同步包装器结果: {'成功' if result else '失败'}")
-            return result
-        finally:
-            loop.close()
+        # asyncio.run按当前策略创建并关闭事件循环
+        result = asyncio.run(test_playwright_basic())
+        print(f"同步包装器结果: {'成功' if result else '失败'}")
+        return result
             
     except Exception as e:
         print(f"❌ 同步包装器测试失败: {e}")
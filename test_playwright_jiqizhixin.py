@@ -15,25 +15,26 @@ def main():
     
     try:
         logger.info("\n开始爬取文章...")
-        articles = crawler.crawl_latest(max_articles=3)
+        # 列表页需要浏览器渲染；详情页只取元数据和正文，先尝试普通HTTP请求
+        articles = crawler.crawl_latest(max_articles=3, prefer_http=True)
         
         if articles:
-            logger.success(f"\n✅ 成功爬取 {len(articles)} 篇文章\n")
+            logger.success("\n✅ 成功爬取 {} 篇文章\n", len(articles))
             
             for i, article in enumerate(articles, 1):
-                logger.info(f"{'='*60}")
-                logger.info(f"文章 [{i}]")
-                logger.info(f"{'='*60}")
-                logger.info(f"标题: {article.title}")
-                logger.info(f"URL: {article.url}")
-                logger.info(f"作者: {article.author or '未知'}")
-                logger.info(f"时间: {article.publish_time or '未知'}")
-                logger.info(f"内容长度: {len(article.content)} 字符")
-                logger.info(f"标签: {', '.join(article.tags)}")
+                logger.info('='*60)
+                logger.info("文章 [{}]", i)
+                logger.info('='*60)
+                logger.info("标题: {}", article.title)
+                logger.info("URL: {}", article.url)
+                logger.info("作者: {}", article.author or '未知')
+                logger.info("时间: {}", article.publish_time or '未知')
+                logger.info("内容长度: {} 字符", len(article.content))
+                logger.info("标签: {}", ', '.join(article.tags))
                 
                 if article.content:
                     preview = article.content[:200].replace('\n', ' ')
-                    logger.info(f"内容预览: {preview}...")
+                    logger.info("内容预览: {}...", preview)
                 logger.info("")
             
             # 保存文章
@@ -46,9 +47,12 @@ def main():
     except KeyboardInterrupt:
         logger.warning("\n⚠️ 用户中断")
     except Exception as e:
-        logger.error(f"❌ 爬取失败: {e}")
+        logger.error("❌ 爬取失败: {}", e)
         import traceback
         logger.error(traceback.format_exc())
+    finally:
+        # 列表页和各文章页共用一个浏览器，结束时统一关闭
+        crawler.close()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,4 @@
 """简单测试Playwright功能"""
-from playwright.sync_api import sync_playwright
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -13,6 +12,8 @@ def test_playwright():
     url = "https://www.36kr.com/information/AI/"
     
     try:
+        from playwright.sync_api import sync_playwright
+        
         with sync_playwright() as p:
             logger.info("启动浏览器...")
             browser = p.chromium.launch(headless=True)
@@ -20,23 +21,24 @@ def test_playwright():
             logger.info("创建页面...")
             page = browser.new_page()
             
-            logger.info(f"访问: {url}")
-            page.goto(url, wait_until='networkidle', timeout=30000)
+            logger.info("访问: {}", url)
+            # DOM就绪即可，不等待广告等请求全部结束
+            page.goto(url, wait_until='domcontentloaded', timeout=15000)
             
             logger.info("等待页面加载...")
-            page.wait_for_timeout(2000)
+            page.wait_for_selector('a', timeout=5000)
             
             # 获取标题
             title = page.title()
-            logger.success(f"✅ 页面标题: {title}")
+            logger.success("✅ 页面标题: {}", title)
             
             # 获取页面内容
             html = page.content()
-            logger.success(f"✅ 页面内容长度: {len(html)} 字符")
+            logger.success("✅ 页面内容长度: {} 字符", len(html))
             
             # 查找链接
             links = page.query_selector_all('a')
-            logger.success(f"✅ 找到 {len(links)} 个链接")
+            logger.success("✅ 找到 {} 个链接", len(links))
             
             # 显示前几个链接
             logger.info("\n前5个链接:")
@@ -45,7 +47,7 @@ def test_playwright():
                     text = link.inner_text()
                     href = link.get_attribute('href')
                     if text and href:
-                        logger.info(f"  [{i}] {text[:40]} -> {href[:60]}")
+                        logger.info("  [{}] {} -> {}", i, text[:40], href[:60])
                 except:
                     pass
             
@@ -54,7 +56,7 @@ def test_playwright():
             return True
             
     except Exception as e:
-        logger.error(f"❌ 测试失败: {e}")
+        logger.error("❌ 测试失败: {}", e)
         import traceback
         logger.error(traceback.format_exc())
         return False
@@ -5,22 +5,28 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.crawlers.kr36_ai import Kr36AICrawler
 from src.utils.logger import logger
-import requests
+import functools
+import socket
+
+@functools.lru_cache(maxsize=32)
+def _reachable(host, port=443):
+    """只建立TCP连接判断主机是否可达（比完整的HTTPS请求轻得多），结果缓存"""
+    try:
+        socket.create_connection((host, port), timeout=1).close()
+        return True
+    except OSError:
+        return False
 
 def test_connection():
     """测试网站连接"""
-    url = "https://www.36kr.com"
-    logger.info(f"测试连接: {url}")
+    host = "www.36kr.com"
+    logger.info("测试连接: {}", host)
     
-    try:
-        response = requests.get(url, timeout=5, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        logger.success(f"✅ 连接成功! 状态码: {response.status_code}")
+    if _reachable(host):
+        logger.success("✅ 连接成功!")
         return True
-    except Exception as e:
-        logger.error(f"❌ 连接失败: {e}")
-        return False
+    logger.error("❌ 连接失败: {}:443 不可达", host)
+    return False
 
 def test_crawl():
     """测试爬取"""
@@ -37,22 +43,22 @@ def test_crawl():
     try:
         articles = crawler.crawl_latest(max_articles=3)
         
-        logger.success(f"\n✅ 成功爬取 {len(articles)} 篇文章")
+        logger.success("\n✅ 成功爬取 {} 篇文章", len(articles))
         
         for i, article in enumerate(articles, 1):
-            logger.info(f"\n[{i}] {article.title}")
-            logger.info(f"    URL: {article.url}")
-            logger.info(f"    作者: {article.author}")
-            logger.info(f"    时间: {article.publish_time}")
-            logger.info(f"    内容长度: {len(article.content)} 字符")
-            logger.info(f"    标签: {', '.join(article.tags)}")
+            logger.info("\n[{}] {}", i, article.title)
+            logger.info("    URL: {}", article.url)
+            logger.info("    作者: {}", article.author)
+            logger.info("    时间: {}", article.publish_time)
+            logger.info("    内容长度: {} 字符", len(article.content))
+            logger.info("    标签: {}", ', '.join(article.tags))
         
         if articles:
             crawler.save_articles(articles)
             logger.success(f"\n💾 文章已保存")
         
     except Exception as e:
-        logger.error(f"❌ 爬取失败: {e}")
+        logger.error("❌ 爬取失败: {}", e)
         import traceback
         traceback.print_exc()
 
@@ -1,4 +1,10 @@
-import requests
+from test_utils import get_session, response_json
+
+_SESSION = get_session()
+
+# 摘要质量分析用的关键词（小写，与小写后的摘要比较）
+PROJECT_INDICATORS = ['remotion', 'video', 'react', '动画', '组件', 'motion']
+TECH_INDICATORS = ['react', 'javascript', 'typescript', '框架', '库', 'render']
 
 def test_real_project_enhanced_summary():
     """测试真实项目的增强摘要生成功能"""
@@ -7,20 +13,20 @@ def test_real_project_enhanced_summary():
     print("=" * 50)
     
     # 获取现有项目
-    projects = requests.get('http://localhost:8080/api/github/projects').json()
+    projects = response_json(_SESSION.get('http://localhost:8080/api/github/projects'))
     if projects:
         project_id = projects[0]['id']
         print(f'使用项目: {project_id}')
         
         # 获取项目详细信息
-        project_detail = requests.get(f'http://localhost:8080/api/github/projects/{project_id}').json()
+        project_detail = response_json(_SESSION.get(f'http://localhost:8080/api/github/projects/{project_id}'))
         readme_length = len(project_detail['readme_content'])
         print(f'README长度: {readme_length} 字符')
         print(f'README预览: {project_detail["readme_content"][:150]}...')
         print()
         
         # 生成内容（使用增强的摘要功能）
-        response = requests.post(
+        response = _SESSION.post(
             'http://localhost:8080/api/github/generate-content',
             json={
                 'project_id': project_id,
@@ -29,7 +35,7 @@ def test_real_project_enhanced_summary():
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             metadata = result['video_metadata']
             print('🎯 增强摘要结果:')
             print(f'标题: {metadata["title"]}')
@@ -43,15 +49,14 @@ def test_real_project_enhanced_summary():
             summary_length = len(metadata['summary'])
             print(f'摘要长度: {summary_length} 字符')
             
+            summary_lower = metadata['summary'].lower()
+            
             # 检查是否包含项目相关信息
-            project_indicators = ['remotion', 'video', 'react', '动画', '组件', 'motion']
-            found_indicators = [indicator for indicator in project_indicators 
-                              if indicator.lower() in metadata['summary'].lower()]
+            found_indicators = [indicator for indicator in PROJECT_INDICATORS if indicator in summary_lower]
             print(f'包含项目关键词: {", ".join(found_indicators) if found_indicators else "无"}')
             
             # 检查技术信息
-            tech_indicators = ['react', 'javascript', 'typescript', '框架', '库', 'render']
-            has_tech_info = any(indicator in metadata['summary'].lower() for indicator in tech_indicators)
+            has_tech_info = any(indicator in summary_lower for indicator in TECH_INDICATORS)
             print(f'包含技术信息: {"✅" if has_tech_info else "❌"}')
             
             # 检查是否比以前更详细
@@ -3,12 +3,17 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import feedparser
-import requests
+import asyncio
+import aiohttp
 from datetime import datetime
 from src.models.article import Article
 from src.utils.logger import logger
-import json
+import orjson
+from urllib.parse import urlparse
+
+RSS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
 
 # 常见的AI资讯RSS源
 RSS_SOURCES = {
@@ -18,24 +23,40 @@ RSS_SOURCES = {
     "36氪AI": "https://36kr.com/feed/ai",
 }
 
-def fetch_rss(name, url, max_articles=10):
+async def _reachable(host, port=443, timeout=1):
+    """只建立TCP连接判断主机是否可达，不可达的源不必等待完整的请求超时"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+async def fetch_rss(session, name, url, max_articles=10):
     """获取RSS订阅"""
-    logger.info(f"正在获取 {name}: {url}")
+    import feedparser
+    
+    logger.info("正在获取 {}: {}", name, url)
+    
+    if not await _reachable(urlparse(url).hostname):
+        logger.warning("❌ {} 无法连接，跳过", name)
+        return []
     
     try:
-        # 使用requests获取，避免feedparser的网络问题
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code != 200:
-            logger.warning(f"{name} 返回状态码: {response.status_code}")
-            return []
+        # 使用aiohttp获取，避免feedparser的网络问题（UA已在会话上统一设置）
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                logger.warning("{} 返回状态码: {}", name, response.status)
+                return []
+            content = await response.read()
+            content_type = response.headers.get('Content-Type', 'application/rss+xml')
         
-        # 解析RSS
-        feed = feedparser.parse(response.content)
-        logger.success(f"✅ {name} - 找到 {len(feed.entries)} 条资讯")
+        # 解析RSS：带上响应头，feedparser直接使用声明的类型和编码，不再自行探测
+        feed = feedparser.parse(content, response_headers={
+            'content-type': content_type,
+            'content-location': url,
+        })
+        logger.success("✅ {} - 找到 {} 条资讯", name, len(feed.entries))
         
         articles = []
         for entry in feed.entries[:max_articles]:
@@ -53,30 +74,34 @@ def fetch_rss(name, url, max_articles=10):
                     images=[]
                 )
                 articles.append(article)
-                logger.info(f"  - {article.title}")
+                logger.info("  - {}", article.title)
             except Exception as e:
-                logger.error(f"解析条目失败: {e}")
+                logger.error("解析条目失败: {}", e)
                 continue
         
         return articles
         
-    except requests.Timeout:
-        logger.warning(f"❌ {name} 超时")
+    except asyncio.TimeoutError:
+        logger.warning("❌ {} 超时", name)
     except Exception as e:
-        logger.error(f"❌ {name} 错误: {e}")
+        logger.error("❌ {} 错误: {}", name, e)
     
     return []
 
-def main():
+async def main():
     """主函数"""
     all_articles = []
     
-    for name, url in RSS_SOURCES.items():
-        articles = fetch_rss(name, url, max_articles=5)
+    # 各订阅源并发获取，结果按RSS_SOURCES的顺序合并
+    async with aiohttp.ClientSession(headers=RSS_HEADERS) as session:
+        results = await asyncio.gather(
+            *(fetch_rss(session, name, url, max_articles=5) for name, url in RSS_SOURCES.items())
+        )
+    for articles in results:
         all_articles.extend(articles)
     
     if all_articles:
-        logger.success(f"\n📊 总共获取 {len(all_articles)} 篇文章")
+        logger.success("\n📊 总共获取 {} 篇文章", len(all_articles))
         
         # 保存到JSON
         output_dir = Path("data/raw/rss")
@@ -86,12 +111,11 @@ def main():
         output_file = output_dir / f"articles_{timestamp}.json"
         
         data = [article.to_dict() for article in all_articles]
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        output_file.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
         
-        logger.success(f"💾 已保存到: {output_file}")
+        logger.success("💾 已保存到: {}", output_file)
     else:
         logger.warning("未获取到任何文章")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -6,14 +8,10 @@ from services.github_content_service import ContentAnalyzer
 from src.models.github_models import GitHubProject
 from datetime import datetime
 
-def test_system_prompt_enhancement():
-    """测试System Prompt增强效果"""
-    
-    print("🤖 测试System Prompt增强效果")
-    print("=" * 50)
-    
-    # 创建测试项目
-    test_project = GitHubProject(
+@functools.lru_cache(maxsize=1)
+def _fixture_project():
+    """构造测试项目（只做一次pydantic校验，重复调用直接复用）"""
+    return GitHubProject(
         id="system_prompt_test",
         url="https://github.com/test/awesome-project",
         name="AwesomeProject",
@@ -57,6 +55,34 @@ app.run()
         """,
         images=[]
     )
+
+# 缓存键 -> 项目对象，供_cached_analyze按键取回原项目
+_PROJECTS_BY_KEY = {}
+
+def _project_key(project):
+    """用全名、Star数和README摘要作为项目的稳定缓存键"""
+    readme_digest = hashlib.blake2b((project.readme_content or '').encode('utf-8'), digest_size=16).hexdigest()
+    return (project.full_name, project.stars, readme_digest)
+
+@functools.lru_cache(maxsize=128)
+def _cached_analyze(project_key):
+    """同一进程内相同项目只分析一次，重复调用直接复用结果"""
+    return ContentAnalyzer().analyze_project_content(_PROJECTS_BY_KEY[project_key])
+
+def _analyze_project(project):
+    """分析项目内容（测试层缓存），返回结果副本，调用方修改不影响缓存"""
+    key = _project_key(project)
+    _PROJECTS_BY_KEY.setdefault(key, project)
+    return _cached_analyze(key).model_copy(deep=True)
+
+def test_system_prompt_enhancement():
+    """测试System Prompt增强效果"""
+    
+    print("🤖 测试System Prompt增强效果")
+    print("=" * 50)
+    
+    # 创建测试项目
+    test_project = _fixture_project()
     
     print("📋 测试项目信息:")
     print(f"   项目名称: {test_project.name}")
@@ -65,8 +91,7 @@ app.run()
     print()
     
     # 测试内容生成
-    analyzer = ContentAnalyzer()
-    metadata = analyzer.analyze_project_content(test_project)
+    metadata = _analyze_project(test_project)
     
     print("🎯 System Prompt增强后的内容:")
     print(f"标题: {metadata.title}")
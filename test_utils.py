@@ -0,0 +1,57 @@
+"""
+测试脚本共用的HTTP会话和辅助函数
+"""
+
+import atexit
+import functools
+import os
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """返回进程内共享的会话：复用连接池和keep-alive，避免每次请求重新握手"""
+    session = requests.Session()
+    # 统一的重试策略：只在服务重启等返回的瞬时错误状态码上按退避重试。
+    # 连接失败和读超时不重试，避免超时被放大；POST不重试，避免重复触发服务端任务
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            connect=0,
+            read=0,
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods={'GET', 'HEAD'},
+            raise_on_status=False  # 重试用尽后返回最后的响应，交给原有状态码分支处理
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    atexit.register(session.close)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def get_probe_session() -> requests.Session:
+    """返回不做任何重试的会话，用于连通性探测，目标不可达时按超时立即失败"""
+    session = requests.Session()
+    atexit.register(session.close)
+    return session
+
+
+def response_json(response):
+    """用orjson解析JSON响应"""
+    return orjson.loads(response.content)
+
+
+def file_size_kb(path):
+    """返回文件大小(KB)，文件不存在返回None（一次stat同时完成存在性检查）"""
+    try:
+        return os.stat(path).st_size / 1024
+    except FileNotFoundError:
+        return None
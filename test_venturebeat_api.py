@@ -1,6 +1,8 @@
-import requests
+from test_utils import get_session
 import json
 
+_SESSION = get_session()
+
 def test_venturebeat_api():
     url = "http://localhost:8080/api/fetch-venturebeat"
     payload = {
@@ -8,9 +10,8 @@ def test_venturebeat_api():
     }
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             url,
-            headers={"Content-Type": "application/json"},
             json=payload,
             timeout=60
         )
@@ -2,40 +2,47 @@
 VentureBeat爬虫集成测试
 测试index.html网页爬取功能中的VentureBeat文章抓取
 """
-import requests
+import asyncio
+import aiohttp
 import json
-import time
+import orjson
 
-def test_index_integration():
+# 两个接口测试的是同一篇文章，请求体只序列化一次
+TEST_URL = "https://venturebeat.com/orchestration/new-agent-framework-matches-human-engineered-ai-systems-and-adds-zero"
+TEST_BODY = orjson.dumps({"url": TEST_URL})
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+async def _post_json(session, url, body, timeout):
+    """POST已序列化的JSON请求体，返回 (状态码, JSON结果或None, 响应文本)"""
+    async with session.post(url, data=body, headers=JSON_HEADERS,
+                            timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        text = await response.text()
+        data = json.loads(text) if response.status == 200 else None
+        return response.status, data, text
+
+async def test_index_integration(session):
     """测试index.html集成的VentureBeat爬取功能"""
     
     print("🚀 测试index.html集成的VentureBeat爬虫功能")
     print("=" * 60)
     
-    # 测试URL
-    test_url = "https://venturebeat.com/orchestration/new-agent-framework-matches-human-engineered-ai-systems-and-adds-zero"
-    
     # 使用普通的fetch-url接口（会自动识别VentureBeat URL并转发）
     url = "http://localhost:8080/api/fetch-url"
-    payload = {
-        "url": test_url
-    }
     
     try:
-        print(f"正在测试URL: {test_url}")
+        print(f"正在测试URL: {TEST_URL}")
         print("使用普通接口，系统会自动识别并使用专门的VentureBeat处理逻辑")
         
-        response = requests.post(
+        status, data, text = await _post_json(
+            session,
             url,
-            headers={"Content-Type": "application/json"},
-            json=payload,
+            TEST_BODY,
             timeout=120  # 增加超时时间因为要下载图片
         )
         
-        print(f"响应状态码: {response.status_code}")
+        print(f"响应状态码: {status}")
         
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             result_data = data.get('data', {})
             
             print("\n✅ 爬取成功!")
@@ -72,14 +79,14 @@ def test_index_integration():
             return True
             
         else:
-            print(f"❌ 请求失败: {response.text}")
+            print(f"❌ 请求失败: {text}")
             return False
             
     except Exception as e:
         print(f"❌ 测试异常: {e}")
         return False
 
-def test_direct_venturebeat_api():
+async def test_direct_venturebeat_api(session):
     """直接测试VentureBeat专用API"""
     
     print("\n" + "=" * 60)
@@ -87,46 +94,33 @@ def test_direct_venturebeat_api():
     print("=" * 60)
     
     url = "http://localhost:8080/api/fetch-venturebeat"
-    payload = {
-        "url": "https://venturebeat.com/orchestration/new-agent-framework-matches-human-engineered-ai-systems-and-adds-zero"
-    }
     
     try:
-        response = requests.post(
-            url,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=60
-        )
+        status, data, text = await _post_json(session, url, TEST_BODY, timeout=60)
         
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             print("✅ 专用API调用成功!")
             print(f"消息: {data.get('message', 'N/A')}")
             return True
         else:
-            print(f"❌ 专用API调用失败: {response.status_code}")
-            print(f"错误详情: {response.text}")
+            print(f"❌ 专用API调用失败: {status}")
+            print(f"错误详情: {text}")
             return False
             
     except Exception as e:
         print(f"❌ 专用API测试异常: {e}")
         return False
 
-def main():
+async def main():
     """主测试函数"""
     print("🌐 AINews VentureBeat爬虫集成测试")
     print("测试环境: http://localhost:8080")
     print("=" * 60)
     
-    # 测试直接API
-    direct_success = test_direct_venturebeat_api()
-    
-    # 等待一下避免请求过于频繁
-    time.sleep(2)
-    
-    # 测试集成API
-    integration_success = test_index_integration()
+    # 两个接口最终都会抓取同一篇VentureBeat文章，共用一个会话依次测试，输出也不会交错
+    async with aiohttp.ClientSession() as session:
+        direct_success = await test_direct_venturebeat_api(session)
+        integration_success = await test_index_integration(session)
     
     # 总结
     print("\n" + "=" * 60)
@@ -146,4 +140,4 @@ def main():
         print("\n⚠️  部分测试失败，请检查配置")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
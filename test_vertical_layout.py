@@ -1,6 +1,40 @@
-import requests
+import hashlib
+import json
+from pathlib import Path
+from test_utils import get_session
 import time
 
+_SESSION = get_session()
+
+# 本地缓存：相同参数处理过的项目直接复用project_id，重复运行时跳过耗时的克隆和图片分析
+_PROJECT_CACHE_FILE = Path('.test_cache/project_ids.json')
+
+def _payload_key(payload):
+    """按请求参数生成稳定的缓存键"""
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _load_project_cache():
+    try:
+        return json.loads(_PROJECT_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def _get_cached_project_id(payload):
+    """返回缓存中仍存在于服务端的project_id，否则返回None"""
+    project_id = _load_project_cache().get(_payload_key(payload))
+    if not project_id:
+        return None
+    
+    # 服务端可能已删除或重置项目，使用缓存前先确认项目仍然存在
+    response = _SESSION.get(f'http://localhost:8080/api/github/projects/{project_id}', timeout=10)
+    return project_id if response.status_code == 200 else None
+
+def _cache_project_id(payload, project_id):
+    cache = _load_project_cache()
+    cache[_payload_key(payload)] = project_id
+    _PROJECT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _PROJECT_CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+
 def test_vertical_layout():
     """测试竖版界面布局"""
     
@@ -20,18 +54,27 @@ def test_vertical_layout():
     }
     
     try:
-        response = requests.post(
-            'http://localhost:8080/api/github/process-project',
-            json=payload,
-            timeout=60
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            project_id = result['project_id']
-            print("✅ 项目处理成功!")
+        project_id = _get_cached_project_id(payload)
+        if project_id:
+            print("✅ 复用已缓存的项目，跳过处理步骤")
             print(f"   项目ID: {project_id}")
+        else:
+            response = _SESSION.post(
+                'http://localhost:8080/api/github/process-project',
+                json=payload,
+                timeout=60
+            )
             
+            if response.status_code == 200:
+                result = response.json()
+                project_id = result['project_id']
+                _cache_project_id(payload, project_id)
+                print("✅ 项目处理成功!")
+                print(f"   项目ID: {project_id}")
+            else:
+                print(f"❌ 项目处理失败: {response.status_code}")
+        
+        if project_id:
             # 步骤2: 生成内容
             print("\n2️⃣ 步骤2：生成视频内容")
             content_payload = {
@@ -39,7 +82,7 @@ def test_vertical_layout():
                 'selected_images': []
             }
             
-            content_response = requests.post(
+            content_response = _SESSION.post(
                 'http://localhost:8080/api/github/generate-content',
                 json=content_payload,
                 timeout=30
@@ -58,7 +101,7 @@ def test_vertical_layout():
                     'include_audio': False
                 }
                 
-                video_response = requests.post(
+                video_response = _SESSION.post(
                     'http://localhost:8080/api/github/generate-video',
                     json=video_payload,
                     timeout=120
@@ -71,7 +114,7 @@ def test_vertical_layout():
                     
                     # 步骤4: 验证视频预览
                     print("\n4️⃣ 步骤4：验证视频预览")
-                    preview_response = requests.get(
+                    preview_response = _SESSION.get(
                         f'http://localhost:8080/api/github/projects/{project_id}/video'
                     )
                     
@@ -86,9 +129,6 @@ def test_vertical_layout():
                     
             else:
                 print(f"❌ 内容生成失败: {content_response.status_code}")
-                
-        else:
-            print(f"❌ 项目处理失败: {response.status_code}")
             
     except Exception as e:
         print(f"❌ 测试过程中出现异常: {e}")
@@ -21,13 +21,16 @@ def test_video_thumbnail_generation():
     """测试视频缩略图生成功能"""
     print("🔍 测试视频缩略图生成功能...")
     
-    # 检查是否有视频文件
+    # 检查是否有视频文件（一次scandir列出目录，视频和缩略图都在内存中匹配）
     video_dir = Path("data/videos")
-    if not video_dir.exists():
+    try:
+        with os.scandir(video_dir) as it:
+            file_names = [e.name for e in it if e.is_file() and not e.name.startswith('.')]
+    except FileNotFoundError:
         print("❌ 视频目录不存在")
         return False
     
-    video_files = list(video_dir.glob("*.mp4"))
+    video_files = [name for name in file_names if name.endswith('.mp4')]
     if not video_files:
         print("❌ 没有找到视频文件")
         return False
@@ -36,13 +39,13 @@ def test_video_thumbnail_generation():
     
     # 测试第一个视频文件
     test_video = video_files[0]
-    print(f"📝 测试文件: {test_video.name}")
+    print(f"📝 测试文件: {test_video}")
     
     # 检查对应的缩略图是否存在
-    thumbnail_path = test_video.with_suffix('.jpg')
-    if thumbnail_path.exists():
-        size = thumbnail_path.stat().st_size
-        print(f"✅ 缩略图已存在: {thumbnail_path.name} ({size} bytes)")
+    thumbnail_name = test_video[:-len('.mp4')] + '.jpg'
+    if thumbnail_name in set(file_names):
+        size = os.stat(video_dir / thumbnail_name).st_size
+        print(f"✅ 缩略图已存在: {thumbnail_name} ({size} bytes)")
         return True
     else:
         print("⚠️ 缩略图不存在，需要生成")
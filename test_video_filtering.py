@@ -4,8 +4,16 @@
 测试视频文件过滤功能
 """
 
-import requests
+import os
+from test_utils import get_session
 import json
+import orjson
+
+_SESSION = get_session()
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# 与视频接口的过滤规则保持一致的视频扩展名
+_VIDEO_EXTS = frozenset({'.mp4', '.webm', '.mov'})
 
 def test_video_filtering():
     """测试视频文件过滤功能"""
@@ -26,14 +34,16 @@ def test_video_filtering():
     
     print(f"发送的文件列表:")
     for i, file_path in enumerate(test_data['images'], 1):
-        file_type = "视频" if file_path.lower().endswith(('.mp4', '.webm', '.mov')) else "图片"
+        ext = os.path.splitext(file_path)[1].lower()
+        file_type = "视频" if ext in _VIDEO_EXTS else "图片"
         print(f"  {i}. {file_path} [{file_type}]")
     
     try:
         # 调用API
-        response = requests.post(
+        response = _SESSION.post(
             "http://localhost:8080/api/create-animated-video",
-            json=test_data,
+            data=orjson.dumps(test_data),
+            headers=JSON_HEADERS,
             timeout=30
         )
         
@@ -82,9 +92,10 @@ def test_only_images():
     }
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "http://localhost:8080/api/create-animated-video",
-            json=test_data,
+            data=orjson.dumps(test_data),
+            headers=JSON_HEADERS,
             timeout=30
         )
         
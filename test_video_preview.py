@@ -1,6 +1,9 @@
-import requests
+import os
+from test_utils import get_session
 import time
 
+_SESSION = get_session()
+
 def test_video_preview_feature():
     """测试视频预览功能"""
     
@@ -17,7 +20,7 @@ def test_video_preview_feature():
     }
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             'http://localhost:8080/api/github/generate-video',
             json=payload,
             timeout=120
@@ -32,23 +35,25 @@ def test_video_preview_feature():
             
             # 测试视频预览API
             print("\n2. 测试视频预览功能...")
-            video_response = requests.get(
-                f'http://localhost:8080/api/github/projects/{project_id}/video'
-            )
-            
-            if video_response.status_code == 200:
-                print("✅ 视频预览API正常工作!")
-                print(f"   视频大小: {len(video_response.content)} bytes")
-                print(f"   内容类型: {video_response.headers.get('content-type', 'unknown')}")
-                
-                # 保存测试视频
-                with open(f'test_preview_{project_id}.mp4', 'wb') as f:
-                    f.write(video_response.content)
-                print(f"   测试视频已保存为: test_preview_{project_id}.mp4")
-                
-            else:
-                print(f"❌ 视频预览API失败: {video_response.status_code}")
-                print(f"   错误信息: {video_response.text}")
+            # 流式下载：边接收边写盘，内存中只保留一个分块
+            with _SESSION.get(
+                f'http://localhost:8080/api/github/projects/{project_id}/video',
+                stream=True
+            ) as video_response:
+                if video_response.status_code == 200:
+                    video_path = f'test_preview_{project_id}.mp4'
+                    with open(video_path, 'wb') as f:
+                        for chunk in video_response.iter_content(chunk_size=64 * 1024):
+                            f.write(chunk)
+                    
+                    print("✅ 视频预览API正常工作!")
+                    print(f"   视频大小: {os.path.getsize(video_path)} bytes")
+                    print(f"   内容类型: {video_response.headers.get('content-type', 'unknown')}")
+                    print(f"   测试视频已保存为: {video_path}")
+                    
+                else:
+                    print(f"❌ 视频预览API失败: {video_response.status_code}")
+                    print(f"   错误信息: {video_response.text}")
                 
         else:
             print(f"❌ 视频生成失败: {response.status_code}")
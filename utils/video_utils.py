@@ -330,12 +330,18 @@ def _draw_text_overlay(bg, lines, font, start_y, img_width, margin, text_width,
     # 半透明背景
     bg_y = start_y - 25
     bg_h = total_h + 40
-    overlay = Image.new('RGBA', bg.size, (0, 0, 0, 0))
-    od = ImageDraw.Draw(overlay)
-    for i in range(bg_h):
-        p = i / bg_h
-        alpha = int(220 * (min(p, 1 - p) / 0.1 if min(p, 1 - p) < 0.1 else 1))
-        od.rectangle([(0, bg_y + i), (img_width, bg_y + i + 1)], fill=(20, 20, 40, alpha))
+    # 上下边缘10%渐入渐出的透明度，整块用numpy一次填充（末行沿用最后一档透明度）
+    p = np.arange(bg_h) / bg_h
+    edge = np.minimum(p, 1 - p)
+    alpha = (220 * np.where(edge < 0.1, edge / 0.1, 1)).astype(np.uint8)
+    alpha = np.append(alpha, alpha[-1])
+    buf = np.zeros((bg.size[1], bg.size[0], 4), np.uint8)
+    y0, y1 = max(bg_y, 0), min(bg_y + bg_h + 1, bg.size[1])
+    if y0 < y1:
+        band = buf[y0:y1, :img_width + 1]
+        band[..., :3] = (20, 20, 40)
+        band[..., 3] = alpha[y0 - bg_y:y1 - bg_y, None]
+    overlay = Image.fromarray(buf, 'RGBA')
     result = Image.alpha_composite(bg.convert('RGBA'), overlay).convert('RGB')
     draw = ImageDraw.Draw(result)
 